@@ -0,0 +1,143 @@
+# bench_scheduler.py
+"""Benchmarks reproducibles del motor de planificación.
+
+    python bench_scheduler.py -n 1000,10000 -o bench.json
+    python bench_scheduler.py -n 10000 --compare bench.json
+"""
+import argparse, json, platform, random, subprocess, sys, time, tracemalloc
+from typing import Dict, List
+from scheduler_sim import Process, Scheduler
+from scheduler_profile import profile
+
+ALGORITHMS = ("FCFS", "SJF", "SRTF", "RR")
+BURSTS = ("uniform", "exponential", "pareto")
+
+def make_workload(n: int, burst: str = "exponential", mean_burst: float = 10.0,
+                  density: float = 0.8, seed: int = 1) -> List[Process]:
+    """Carga sintética con semilla: llegadas de Poisson con carga `density` (ráfaga media / separación media)."""
+    rng = random.Random(seed)
+    gap = mean_burst / density
+    t = 0.0
+    out = []
+    for i in range(n):
+        t += rng.expovariate(1 / gap)
+        if burst == "uniform":
+            b = rng.randint(1, int(2 * mean_burst) - 1)
+        elif burst == "exponential":
+            b = rng.expovariate(1 / mean_burst)
+        else:
+            b = rng.paretovariate(1.5) * mean_burst / 3
+        out.append(Process(name=f"P{i}", burst_time=max(1, round(b)), arrival_time=int(t)))
+    return out
+
+def _run(workload, algo, quantum, event_driven):
+    sim = Scheduler(workload, algo, rr_quantum=quantum if algo == "RR" else None, event_driven=event_driven)
+    t0 = time.perf_counter()
+    sim.simulate()
+    return sim, time.perf_counter() - t0
+
+def bench_simulate(workload, algo, quantum, event_driven, memory=True, repeat=3, phases=False) -> Dict:
+    best = None
+    for _ in range(repeat):
+        sim, dt = _run(workload, algo, quantum, event_driven)
+        best = dt if best is None else min(best, dt)
+    row = {"algorithm": algo, "engine": "event" if event_driven else "tick",
+           "seconds": best, "ticks": sim.time, "events": len(sim.timeline.times),
+           "ticks_per_sec": sim.time / best if best else None,
+           "events_per_sec": len(sim.timeline.times) / best if best else None}
+    if memory:
+        tracemalloc.start()
+        _run(workload, algo, quantum, event_driven)
+        row["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if phases:
+        # Corrida aparte: los envoltorios del perfilador no deben contar en `seconds`
+        sim = Scheduler(workload, algo, rr_quantum=quantum if algo == "RR" else None, event_driven=event_driven)
+        rep = profile(sim)[1].report()
+        row["phases"] = {k: v["share"] for k, v in rep["phases"].items()}
+        row["counters"] = rep["counters"]
+    return row
+
+def bench_select(algo: str, ready: int, ops: int = 100000, seed: int = 1) -> Dict:
+    """Coste de Policy.select con `ready` procesos en cola: cada selección reencola al elegido."""
+    rng = random.Random(seed)
+    procs = [Process(name=f"P{i}", burst_time=rng.randint(1, 100), arrival_time=0) for i in range(ready)]
+    sim = Scheduler(procs, algo, rr_quantum=2)
+    sim._admit()
+    policy = sim.policy
+    select = policy.select
+    t0 = time.perf_counter()
+    for _ in range(ops):
+        p = select(sim.running)
+        if policy.preemptive:
+            sim.running = p
+        else:
+            sim.ready.push(p)
+    dt = time.perf_counter() - t0
+    return {"algorithm": algo, "ready": ready, "ops": ops, "seconds": dt, "ops_per_sec": ops / dt}
+
+def run_suite(sizes, bursts, density, quantum, engines, seed, memory, repeat, phases=False) -> Dict:
+    results = {"meta": {"python": platform.python_version(), "platform": platform.platform(),
+                        "commit": _git_commit(), "seed": seed, "density": density, "quantum": quantum},
+               "simulate": [], "select": []}
+    for n in sizes:
+        for burst in bursts:
+            wl = make_workload(n, burst, density=density, seed=seed)
+            for algo in ALGORITHMS:
+                for engine in engines:
+                    row = bench_simulate(wl, algo, quantum, engine == "event", memory, repeat, phases)
+                    row.update(n=n, burst=burst)
+                    results["simulate"].append(row)
+                    print(f"{algo:5} {engine:5} n={n:<7} {burst:11} {row['seconds']*1e3:9.1f} ms "
+                          f"{row['ticks_per_sec'] or 0:12.0f} ticks/s {row['events_per_sec'] or 0:12.0f} ev/s",
+                          file=sys.stderr)
+                    if phases:
+                        print("      " + " ".join(f"{k}={v:.0%}" for k, v in row["phases"].items()),
+                              file=sys.stderr)
+        for algo in ALGORITHMS:
+            results["select"].append(bench_select(algo, n))
+    return results
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def compare(new: Dict, old: Dict):
+    key = lambda r: (r["algorithm"], r["engine"], r["n"], r["burst"])
+    before = {key(r): r for r in old.get("simulate", [])}
+    for r in new["simulate"]:
+        o = before.get(key(r))
+        if o:
+            print(f"{r['algorithm']:5} {r['engine']:5} n={r['n']:<7} {r['burst']:11} "
+                  f"{o['seconds']*1e3:9.1f} -> {r['seconds']*1e3:9.1f} ms ({r['seconds']/o['seconds']:.2f}x)")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-n", "--sizes", default="1000,10000")
+    ap.add_argument("-b", "--bursts", default=",".join(BURSTS))
+    ap.add_argument("-d", "--density", type=float, default=0.8, help="carga ofrecida (ráfaga media / separación media)")
+    ap.add_argument("-q", "--quantum", type=int, default=4)
+    ap.add_argument("-e", "--engines", default="event,tick")
+    ap.add_argument("-s", "--seed", type=int, default=1)
+    ap.add_argument("-r", "--repeat", type=int, default=3)
+    ap.add_argument("--no-memory", action="store_true", help="no medir memoria pico (tracemalloc)")
+    ap.add_argument("--phases", action="store_true", help="reparto del tiempo por fase del motor (scheduler_profile)")
+    ap.add_argument("-o", "--output", default=None, help="guardar resultados en JSON")
+    ap.add_argument("--compare", default=None, help="JSON de una corrida anterior")
+    args = ap.parse_args(argv)
+    res = run_suite([int(x) for x in args.sizes.split(",")], args.bursts.split(","), args.density,
+                    args.quantum, args.engines.split(","), args.seed, not args.no_memory, args.repeat,
+                    args.phases)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(res, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(res, json.load(f))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
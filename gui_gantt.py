@@ -0,0 +1,186 @@
+# gui_gantt.py
+"""Diagrama de Gantt virtualizado para las GUIs del simulador.
+
+Solo se dibuja la ventana de tiempo visible: con zoom alto se pintan los tramos
+tal cual y con zoom bajo se muestrea un PID por columna de unos pocos píxeles,
+de modo que el coste de dibujo depende del ancho del canvas y no de la duración
+de la simulación.
+"""
+from array import array
+from bisect import bisect_right
+from typing import Dict, Optional
+import tkinter as tk
+from tkinter import ttk
+from scheduler_timeline import OVERHEAD
+
+IDLE = -1
+
+def nice_step(min_ticks: float) -> int:
+    """Menor paso 1/2/5·10^k que cubre `min_ticks` (para las marcas del eje)."""
+    step = 1
+    while True:
+        for m in (1, 2, 5):
+            if step * m >= min_ticks:
+                return step * m
+        step *= 10
+
+class GanttView(ttk.Frame):
+    MAX_PX_PER_TICK = 112.0
+    DEFAULT_PX_PER_TICK = 28.0
+    MIN_BAR_PX = 3      # por debajo de esto se agregan los tramos por columnas
+    LABEL_PX = 22       # ancho mínimo de una barra para rotularla
+    AXIS_PX = 80        # separación aproximada entre marcas del eje
+    PAD, Y, H = 10, 24, 40
+
+    def __init__(self, master, colors: Dict[str, str], height: int = 240, **kw):
+        super().__init__(master, **kw)
+        self.colors = colors
+        self.canvas = tk.Canvas(self, bg=colors["bg_frame"], height=height, highlightthickness=0)
+        self.canvas.pack(side=tk.TOP, fill=tk.X, expand=True)
+        self.scroll = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.xview)
+        self.scroll.pack(side=tk.TOP, fill=tk.X)
+        bar = ttk.Frame(self)
+        bar.pack(side=tk.TOP, anchor="e")
+        ttk.Button(bar, text="−", width=3, command=lambda: self.zoom(0.5)).pack(side=tk.LEFT, padx=2, pady=2)
+        ttk.Button(bar, text="+", width=3, command=lambda: self.zoom(2)).pack(side=tk.LEFT, padx=2, pady=2)
+        ttk.Button(bar, text="Ajustar", command=self.fit).pack(side=tk.LEFT, padx=2, pady=2)
+        self.canvas.bind("<Configure>", lambda _e: self.redraw())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Control-MouseWheel>", self._on_zoom_wheel)
+        # X11 entrega la rueda como botones 4 y 5
+        for btn, d in (("Button-4", 1), ("Button-5", -1)):
+            self.canvas.bind(f"<{btn}>", lambda e, d=d: self.scroll_by(-d))
+            self.canvas.bind(f"<Control-{btn}>", lambda e, d=d: self.zoom(2 if d > 0 else 0.5, e.x))
+        self.clear()
+
+    # ---- Datos ----
+    def clear(self):
+        self.starts, self.ends, self.pids = array("q"), array("q"), array("q")
+        self._cursor = None
+        self.px_per_tick = self.DEFAULT_PX_PER_TICK
+        self.offset = 0.0  # tick en el borde izquierdo
+        self.follow = True
+        self.redraw()
+
+    @property
+    def total(self) -> int:
+        return self.ends[-1] if self.ends else 0
+
+    def update_from(self, timeline):
+        """Incorpora los tramos nuevos de `timeline` (o reinicia si es otra simulación)."""
+        if self._cursor is None or self._cursor.timeline is not timeline:
+            self.clear()
+            self._cursor = timeline.cursor()
+        starts, ends, pids = self.starts, self.ends, self.pids
+        for start, end, run in self._cursor.spans():
+            pid = IDLE if run is None else run
+            if pids and pids[-1] == pid and ends[-1] == start:
+                ends[-1] = end
+            else:
+                starts.append(start); ends.append(end); pids.append(pid)
+        if self.follow:
+            self.offset = max(0.0, self.total - self._visible_ticks())
+        self.redraw()
+
+    # ---- Navegación ----
+    def _width(self) -> int:
+        return max(1, self.canvas.winfo_width() - 2 * self.PAD)
+
+    def _visible_ticks(self) -> float:
+        return self._width() / self.px_per_tick
+
+    def _clamp(self):
+        self.offset = min(max(0.0, self.offset), max(0.0, self.total - self._visible_ticks()))
+        self.follow = self.offset + self._visible_ticks() >= self.total
+
+    def xview(self, *args):
+        if args[0] == "moveto":
+            self.offset = float(args[1]) * self.total
+        elif args[0] == "scroll":
+            step = self._visible_ticks() * (0.9 if args[2] == "pages" else 0.1)
+            self.offset += int(args[1]) * step
+        self._clamp()
+        self.redraw()
+
+    def scroll_by(self, units: int):
+        self.xview("scroll", units, "units")
+
+    def zoom(self, factor: float, x: Optional[float] = None):
+        # Mantiene fijo el tick bajo el puntero; el zoom mínimo encaja toda la simulación
+        x = self._width() / 2 if x is None else max(0, x - self.PAD)
+        anchor = self.offset + x / self.px_per_tick
+        fit = self._width() / max(1, self.total)
+        self.px_per_tick = min(self.MAX_PX_PER_TICK, max(min(fit, self.DEFAULT_PX_PER_TICK), self.px_per_tick * factor))
+        self.offset = anchor - x / self.px_per_tick
+        self._clamp()
+        self.redraw()
+
+    def fit(self):
+        self.zoom(0)
+
+    def _on_wheel(self, e):
+        self.scroll_by(-1 if e.delta > 0 else 1)
+
+    def _on_zoom_wheel(self, e):
+        self.zoom(2 if e.delta > 0 else 0.5, e.x)
+        return "break"
+
+    # ---- Dibujo ----
+    def _pid_at(self, t: float) -> Optional[int]:
+        i = bisect_right(self.ends, t)
+        if i < len(self.starts) and self.starts[i] <= t:
+            return self.pids[i]
+        return None
+
+    def _visible_bars(self, t0: float, t1: float):
+        """(inicio, fin, pid) visibles en [t0, t1); a zoom bajo, agregados por columna."""
+        if self.px_per_tick >= self.MIN_BAR_PX:
+            i = bisect_right(self.ends, t0)
+            while i < len(self.starts) and self.starts[i] < t1:
+                yield self.starts[i], self.ends[i], self.pids[i]
+                i += 1
+            return
+        bucket = self.MIN_BAR_PX / self.px_per_tick
+        b0, pid = t0, self._pid_at(t0 + bucket / 2)
+        t = t0 + bucket
+        while t < t1:
+            nxt = self._pid_at(t + bucket / 2)
+            if nxt != pid:
+                if pid is not None: yield b0, t, pid
+                b0, pid = t, nxt
+            t += bucket
+        if pid is not None: yield b0, min(t1, self.total), pid
+
+    def redraw(self):
+        c, col = self.canvas, self.colors
+        c.delete("all")
+        pad, y, h, px = self.PAD, self.Y, self.H, self.px_per_tick
+        c.create_text(pad, 10, anchor="w", text="PID ejecutado por unidad de tiempo",
+                      font=("Arial", 10, "bold"), fill=col["fg_text"])
+        total = self.total
+        t0 = self.offset
+        t1 = min(total, t0 + self._visible_ticks())
+        for start, end, pid in self._visible_bars(t0, t1):
+            x0 = pad + (max(start, t0) - t0) * px
+            x1 = pad + (min(end, t1) - t0) * px
+            fill = col["bg_frame"] if pid == IDLE else col["line"] if pid == OVERHEAD else col["bg_main"]
+            c.create_rectangle(x0, y, x1, y+h, outline=col["line"], width=1, fill=fill)
+            if x1 - x0 >= self.LABEL_PX:
+                label = "-" if pid == IDLE else "cs" if pid == OVERHEAD else str(pid)
+                c.create_text((x0+x1)/2, y+h/2, text=label,
+                              font=("Arial", 10), fill=col["fg_text"])
+        # Eje de tiempo con marcas a intervalos "redondos"
+        step = nice_step(self.AXIS_PX / px)
+        t = int(t0 // step) * step
+        while t <= t1:
+            if t >= t0:
+                x = pad + (t - t0) * px
+                c.create_line(x, y+h, x, y+h+4, fill=col["muted"])
+                c.create_text(x, y+h+14, text=str(t), font=("Arial", 9), fill=col["muted"])
+            t += step
+        if total:
+            self.scroll.set(t0 / total, t1 / total)
+            c.create_text(pad, y+h+34, anchor="w", font=("Arial", 9), fill=col["muted"],
+                          text=f"Ticks {int(t0)}–{int(t1)} de {total}  ·  {px:g} px/tick  ·  Ctrl+rueda: zoom")
+        else:
+            self.scroll.set(0, 1)
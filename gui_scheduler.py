@@ -10,12 +10,23 @@ Algoritmos: FCFS, SJF, SRTF y Round Robin
 Requiere: scheduler_sim.py en el mismo directorio.
 """
 
-import threading
-import queue
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List
 from scheduler_sim import Process, Scheduler, TIME_UNIT_SECONDS
+from scheduler_realtime import Pacer, run_scheduled
+from gui_gantt import GanttView
+from scheduler_cache import ResultCache
+from scheduler_tuner import tune_quantum
+from scheduler_profile import Profiler, format_report
+
+TIMELINE_PID_LIMIT = 16
+
+def _pid_list(pids: List[int], total: int, tail: bool = False) -> str:
+    if total <= len(pids):
+        return repr(pids)
+    more = f"+{total - len(pids)}"
+    return f"[{more}, {repr(pids)[1:]}" if tail else f"{repr(pids)[:-1]}, {more}]"
 
 class App(tk.Tk):
     def __init__(self):
@@ -89,6 +100,11 @@ class App(tk.Tk):
         self.algorithm = tk.StringVar(value="FCFS")
         self.rr_quantum = tk.StringVar(value="2")
         self.real_time = tk.BooleanVar(value=False)
+        self.profile = tk.BooleanVar(value=False)
+        self.speed = tk.StringVar(value="1")
+        self.pacer = None
+        self.cache = ResultCache()   # repetir la misma carga y configuración no vuelve a simular
+        self._tl_cursor = None
 
         # --- UI
         self._build_input_frame()
@@ -162,11 +178,21 @@ class App(tk.Tk):
         ttk.Label(qf, text="Quantum global (RR):").grid(row=0, column=0, padx=6, pady=2, sticky="e")
         self.ent_rr_quantum = ttk.Entry(qf, width=6, textvariable=self.rr_quantum)
         self.ent_rr_quantum.grid(row=0, column=1, padx=6, pady=2)
+        self.btn_tune = ttk.Button(qf, text="Ajustar", command=self.tune_rr_quantum)
+        self.btn_tune.grid(row=0, column=2, padx=6, pady=2)
 
         # Tiempo real
         tf = ttk.Frame(frm)
         tf.pack(side=tk.LEFT, padx=18, pady=6)
         ttk.Checkbutton(tf, text=f"Tiempo real ({TIME_UNIT_SECONDS}s por unidad)", variable=self.real_time).grid(row=0, column=0, padx=6, pady=2)
+        ttk.Label(tf, text="Velocidad:").grid(row=0, column=1, padx=(6,2), pady=2)
+        cb = ttk.Combobox(tf, width=6, textvariable=self.speed, state="readonly",
+                          values=("0.01", "0.1", "0.5", "1", "2", "5", "10", "100"))
+        cb.grid(row=0, column=2, padx=2, pady=2)
+        cb.bind("<<ComboboxSelected>>", lambda _e: self._apply_speed())
+        self.btn_pause = ttk.Button(tf, text="Pausar", command=self.toggle_pause, state="disabled")
+        self.btn_pause.grid(row=0, column=3, padx=6, pady=2)
+        ttk.Checkbutton(tf, text="Perfilar motor", variable=self.profile).grid(row=0, column=4, padx=6, pady=2)
 
         # Botones
         bf = ttk.Frame(frm)
@@ -203,8 +229,8 @@ class App(tk.Tk):
         right.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(3,6), pady=6)
 
         ttk.Label(right, text="Gantt:").pack(anchor="w")
-        self.canvas = tk.Canvas(right, bg=self.colors["bg_frame"], height=240, highlightthickness=0)
-        self.canvas.pack(fill=tk.X, expand=False, pady=(0,8))
+        self.gantt = GanttView(right, self.colors, height=180)
+        self.gantt.pack(fill=tk.X, expand=False, pady=(0,8))
 
         self.lbl_metrics = ttk.Label(right, text="Métricas:")
         self.lbl_metrics.pack(anchor="w")
@@ -214,6 +240,17 @@ class App(tk.Tk):
         is_rr = self.algorithm.get() == "RR"
         state = "normal" if is_rr else "disabled"
         self.ent_rr_quantum.config(state=state)
+        self.btn_tune.config(state=state)
+
+    def tune_rr_quantum(self):
+        # Busca el quantum con menor respuesta media; los resultados quedan en la caché
+        if not self.processes:
+            messagebox.showwarning("Validación", "Agregue al menos un proceso.")
+            return
+        res = tune_quantum(self.processes, "avg_response", cache=self.cache)
+        self.rr_quantum.set(str(res["quantum"]))
+        messagebox.showinfo("Quantum", f"Quantum {res['quantum']}: respuesta media {res['value']:.2f} "
+                                       f"({res['evaluations']} simulaciones)")
 
     def add_process(self):
         name = self.ent_name.get().strip()
@@ -250,7 +287,8 @@ class App(tk.Tk):
             for item in t.get_children():
                 t.delete(item)
         self.txt_timeline.delete("1.0", tk.END)
-        self.canvas.delete("all")
+        self.gantt.clear()
+        self._tl_cursor = None
         self.lbl_metrics.config(text="Métricas:")
 
     def start_simulation(self):
@@ -268,30 +306,50 @@ class App(tk.Tk):
                 messagebox.showwarning("Validación", "Quantum global (RR) debe ser entero > 0.")
                 return
 
-        # Preparar simulador
-        sim = Scheduler(self.processes, algorithm=algo, rr_quantum=rr_q, real_time=self.real_time.get())
-
         # Si es tiempo real, corremos en hilo para no bloquear la GUI
         if self.real_time.get():
-            q = queue.Queue()
-
-            def run_rt():
-                sim.simulate()  # dormirá 5s por unidad
-                q.put("done")
-
-            def poll_queue():
-                self._render_timeline(sim)
-                if not q.empty():
-                    _ = q.get()
-                    self._render_all(sim)
-                else:
-                    self.after(500, poll_queue)
-
-            threading.Thread(target=run_rt, daemon=True).start()
-            poll_queue()
-        else:
-            sim.simulate()
+            sim = Scheduler(self.processes, algorithm=algo, rr_quantum=rr_q, real_time=True)
+            prof = Profiler(sim).attach() if self.profile.get() else None
+            # El pacer marca el ritmo contra el reloj monotónico; Tk avanza la simulación con after()
+            pacer = self.pacer = Pacer(TIME_UNIT_SECONDS, speed=float(self.speed.get()))
+            self.btn_pause.config(state="normal", text="Pausar")
+
+            def done(sim):
+                if self.pacer is pacer:
+                    self.pacer = None
+                    self.btn_pause.config(state="disabled", text="Pausar")
+                self._render_all(sim)
+                if prof:
+                    prof.detach()
+                    self._show_profile(prof)
+
+            run_scheduled(self.after, sim, pacer, on_step=self._render_live, on_done=done)
+        elif self.profile.get():
+            # Perfilar exige simular de verdad: no se consulta la caché
+            sim = Scheduler(self.processes, algorithm=algo, rr_quantum=rr_q, event_driven=True)
+            with Profiler(sim) as prof:
+                sim.simulate()
             self._render_all(sim)
+            self._show_profile(prof)
+        else:
+            self._render_all(self.cache.run(self.processes, algo, rr_q))
+
+    def _show_profile(self, prof: Profiler):
+        messagebox.showinfo("Perfil del motor", format_report(prof.report()))
+
+    def _apply_speed(self):
+        if self.pacer:
+            self.pacer.set_speed(float(self.speed.get()))
+
+    def toggle_pause(self):
+        if not self.pacer:
+            return
+        if self.pacer.paused:
+            self.pacer.resume()
+            self.btn_pause.config(text="Pausar")
+        else:
+            self.pacer.pause()
+            self.btn_pause.config(text="Reanudar")
 
     # ---- Renderizado en UI ----
     def _render_all(self, sim: Scheduler):
@@ -300,12 +358,24 @@ class App(tk.Tk):
         self._render_metrics(sim)
         self._render_gantt(sim)
 
+    def _render_live(self, sim: Scheduler):
+        self._render_timeline(sim)
+        self._render_gantt(sim)
+
     def _render_timeline(self, sim: Scheduler):
-        self.txt_timeline.delete("1.0", tk.END)
-        self.txt_timeline.insert(tk.END, "t  | RUN | READY       | DONE\n")
-        self.txt_timeline.insert(tk.END, "---+-----+------------+-----------------\n")
-        for t, run, ready, done in sim.timeline:
-            self.txt_timeline.insert(tk.END, f"{t:>2} | {str(run) if run is not None else '-':>3} | {ready!r:<10} | {done!r}\n")
+        # Solo se añaden las filas nuevas desde la última llamada
+        cur = self._tl_cursor
+        if cur is None or cur.timeline is not sim.timeline:
+            cur = self._tl_cursor = sim.timeline.cursor()
+            self.txt_timeline.delete("1.0", tk.END)
+            self.txt_timeline.insert(tk.END, "t  | RUN | READY       | DONE\n")
+            self.txt_timeline.insert(tk.END, "---+-----+------------+-----------------\n")
+        # Con miles de procesos las listas se recortan para que cada fila tenga tamaño acotado
+        rows = "".join(f"{t:>2} | {str(run) if run is not None else '-':>3} | "
+                       f"{_pid_list(ready, cur.n_ready):<10} | {_pid_list(done, cur.n_done, tail=True)}\n"
+                       for t, run, ready, done in cur.rows(TIMELINE_PID_LIMIT))
+        if rows:
+            self.txt_timeline.insert(tk.END, rows)
 
     def _render_results(self, sim: Scheduler):
         for item in self.tree_done.get_children():
@@ -323,29 +393,14 @@ class App(tk.Tk):
                f"  - Espera promedio: {m['avg_waiting']:.2f} unidades\n"
                f"  - Retorno promedio: {m['avg_turnaround']:.2f} unidades\n"
                f"  - Respuesta promedio: {m['avg_response']:.2f} unidades\n"
+               f"  - Respuesta p95 / máx: {m['p95_response']:.2f} / {m['max_response']} unidades\n"
+               f"  - Throughput: {m['throughput']:.3f} procesos/unidad\n"
+               f"  - Uso de CPU: {m['cpu_utilization']:.0%}\n"
                f"  - Unidad de tiempo = {TIME_UNIT_SECONDS} s")
         self.lbl_metrics.config(text=txt)
 
     def _render_gantt(self, sim: Scheduler):
-        self.canvas.delete("all")
-        timeline = sim.timeline
-        if not timeline:
-            return
-        # Parámetros
-        h = 40
-        pad = 10
-        w_unit = 28  # ancho por tick
-        y = 20
-        x = pad
-        # Bloques
-        for idx, (t, run, *_ ) in enumerate(timeline):
-            self.canvas.create_rectangle(x, y, x+w_unit, y+h, outline=self.colors["line"], width=1, fill=self.colors["bg_main"])
-            self.canvas.create_text(x+w_unit/2, y+h/2, text=str(run) if run is not None else "-", font=("Arial", 10), fill=self.colors["fg_text"])
-            # marca de tiempo
-            self.canvas.create_text(x+w_unit/2, y+h+12, text=str(t), font=("Arial", 9), fill=self.colors["muted"])
-            x += w_unit
-        # título
-        self.canvas.create_text(10, 10, anchor="w", text="PID ejecutado por unidad de tiempo", font=("Arial", 10, "bold"), fill=self.colors["fg_text"])
+        self.gantt.update_from(sim.timeline)
 
 if __name__ == "__main__":
     app = App()
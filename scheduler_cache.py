@@ -0,0 +1,202 @@
+# scheduler_cache.py
+"""Caché de resultados direccionada por contenido.
+
+La clave es un hash canónico de la carga (ráfagas, llegadas, quantum, prioridad y
+ráfagas de E/S, en el orden en que las ve el motor) y de la configuración del
+planificador. Los nombres y PID no forman parte de la clave: la línea de tiempo se
+guarda con índices de proceso y se traduce a los PID de quien pregunta.
+Las entradas viven en un LRU en memoria y, opcionalmente, en un directorio en disco.
+"""
+import hashlib, json, os, pickle
+from array import array
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from scheduler_sim import Process, Scheduler
+from scheduler_smp import SmpScheduler
+from scheduler_policies import POLICIES, make_policy
+from scheduler_timeline import Timeline, SmpTimeline
+
+RESULT_FIELDS = ("start_time", "completion_time", "waiting_time", "turnaround_time", "response_time", "io_time")
+
+class CachedRun(NamedTuple):
+    time: Optional[int]
+    metrics: Dict[str, float]
+    # Detalle opcional (los barridos solo guardan métricas)
+    finished: Optional[List[Tuple]] = None     # (índice, *RESULT_FIELDS) en orden de fin
+    timeline: Optional[Tuple] = None           # (end, times, kinds, índices[, cpus]) como bytes
+
+class RunResult:
+    """Ejecución reconstruida de la caché, con la interfaz de lectura de Scheduler."""
+    def __init__(self, algorithm: str, rr_quantum: Optional[int], time: int, metrics: Dict[str, float],
+                 processes: List[Process], finished: List[Process], timeline: Timeline):
+        self.algorithm = algorithm
+        self.rr_quantum = rr_quantum
+        self.time = time
+        self.metrics = metrics
+        self.processes = processes
+        self.finished = finished
+        self.timeline = timeline
+
+    def _compute_metrics(self) -> Dict[str, float]:
+        return self.metrics
+
+def _ordered(processes: Sequence[Process]) -> List[Process]:
+    # Mismo orden que Scheduler: estable por llegada
+    return sorted(processes, key=attrgetter("arrival_time"))
+
+def _normalize(algorithm: str, rr_quantum: Optional[int], config: Dict) -> Tuple[str, Optional[int], Dict]:
+    algo = algorithm.upper()
+    cls = POLICIES.get(algo)
+    if cls is None:
+        raise ValueError("Algoritmo inválido")
+    # El quantum solo cuenta para las políticas que lo usan; los valores por defecto no cuentan
+    q = rr_quantum if cls.needs_quantum else None
+    defaults = {"cpus": 1, "io_devices": 1, "switch_cost": 0, "warmup_cost": 0}
+    cfg = {k: v for k, v in config.items() if v is not None and defaults.get(k, object()) != v}
+    return algo, q, cfg
+
+def run_key(processes: Sequence[Process], algorithm: str, rr_quantum: Optional[int] = None, **config) -> str:
+    """Hash canónico de la carga y la configuración (opciones de política, cpus, costes...)."""
+    algo, q, cfg = _normalize(algorithm, rr_quantum, config)
+    h = hashlib.sha256(json.dumps([algo, q, sorted(cfg.items())], default=list).encode())
+    for p in _ordered(processes):
+        h.update(repr((p.burst_time, p.arrival_time, p.quantum, p.priority, p.bursts)).encode())
+    return h.hexdigest()
+
+def _pack(sim) -> CachedRun:
+    index = {p.pid: i for i, p in enumerate(sim.processes)}
+    finished = [(index[p.pid], *(getattr(p, f) for f in RESULT_FIELDS)) for p in sim.finished]
+    tl = sim.timeline
+    parts = (tl.end, tl.times.tobytes(), tl.kinds.tobytes(), array("q", (index[pid] for pid in tl.pids)).tobytes())
+    if isinstance(tl, SmpTimeline):
+        parts += (tl.ncpu, tl.cpus.tobytes())
+    return CachedRun(sim.time, dict(sim._compute_metrics()), finished, parts)
+
+def _unpack(run: CachedRun, procs: List[Process], algo: str, q: Optional[int]) -> RunResult:
+    clones = [p.clone_for_sim() for p in procs]
+    finished = []
+    for idx, *vals in run.finished:
+        p = clones[idx]
+        p.remaining_time = 0
+        for f, v in zip(RESULT_FIELDS, vals):
+            setattr(p, f, v)
+        finished.append(p)
+    end, times, kinds, idxs, *smp = run.timeline
+    tl = SmpTimeline(smp[0]) if smp else Timeline()
+    tl.times.frombytes(times)
+    tl.kinds.frombytes(kinds)
+    tl.pids.extend(clones[i].pid for i in array("q", idxs))
+    if smp: tl.cpus.frombytes(smp[1])
+    tl.end = end
+    return RunResult(algo, q, run.time, dict(run.metrics), clones, finished, tl)
+
+class ResultCache:
+    """LRU de ejecuciones en memoria (`maxsize` entradas) con un segundo nivel opcional en `path`.
+
+    En disco se guarda un archivo por entrada; al pasar de `disk_maxsize` se borran
+    los de uso más antiguo (la fecha de modificación se renueva en cada acierto).
+    """
+    def __init__(self, maxsize: int = 128, path: Optional[str] = None, disk_maxsize: int = 1024):
+        if maxsize <= 0 or disk_maxsize <= 0:
+            raise ValueError("El tamaño de la caché debe ser > 0")
+        self.maxsize = maxsize
+        self.path = path
+        self.disk_maxsize = disk_maxsize
+        self.hits = self.misses = 0
+        self._mem: "OrderedDict[str, CachedRun]" = OrderedDict()
+        if path:
+            os.makedirs(path, exist_ok=True)
+
+    def __len__(self):
+        return len(self._mem)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key + ".pkl")
+
+    def get(self, key: str) -> Optional[CachedRun]:
+        run = self._mem.get(key)
+        if run is not None:
+            self._mem.move_to_end(key)
+            return run
+        if self.path:
+            try:
+                with open(self._file(key), "rb") as f:
+                    run = CachedRun(*pickle.load(f))
+                os.utime(self._file(key))
+            except (OSError, pickle.UnpicklingError, EOFError, TypeError):
+                return None
+            self._remember(key, run)
+        return run
+
+    def put(self, key: str, run: CachedRun):
+        self._remember(key, run)
+        if self.path:
+            tmp = self._file(key) + ".tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(tuple(run), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._file(key))
+            self._evict_disk()
+
+    def _remember(self, key: str, run: CachedRun):
+        self._mem[key] = run
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.maxsize:
+            self._mem.popitem(last=False)
+
+    def _evict_disk(self):
+        files = [e for e in os.scandir(self.path) if e.name.endswith(".pkl")]
+        if len(files) <= self.disk_maxsize:
+            return
+        files.sort(key=lambda e: e.stat().st_mtime)
+        for e in files[:len(files) - self.disk_maxsize]:
+            try:
+                os.remove(e.path)
+            except OSError:
+                pass
+
+    def clear(self):
+        self._mem.clear()
+        if self.path:
+            for e in os.scandir(self.path):
+                if e.name.endswith(".pkl"): os.remove(e.path)
+
+    def run(self, processes: Sequence[Process], algorithm: str, rr_quantum: Optional[int] = None,
+            policy_options: Optional[Dict] = None, **config):
+        """Simula o devuelve el resultado guardado (RunResult) para la misma carga y configuración.
+
+        `config` son los argumentos de Scheduler/SmpScheduler (cpus, queues, balance,
+        io_devices, switch_cost...); con cpus > 1 se usa SmpScheduler.
+        """
+        opts = policy_options or {}
+        procs = _ordered(processes)
+        algo, q, _ = _normalize(algorithm, rr_quantum, config)
+        key = run_key(procs, algorithm, rr_quantum, **opts, **config)
+        cached = self.get(key)
+        if cached is not None and cached.timeline is not None:
+            self.hits += 1
+            return _unpack(cached, procs, algo, q)
+        self.misses += 1
+        cfg = dict(config)
+        cpus = cfg.pop("cpus", 1)
+        if cpus > 1:
+            sim = SmpScheduler(procs, algorithm, cpus=cpus, rr_quantum=rr_quantum, event_driven=True, **cfg, **opts)
+        else:
+            sim = Scheduler(procs, make_policy(algorithm, rr_quantum, **opts), event_driven=True, **cfg)
+        sim.simulate()
+        self.put(key, _pack(sim))
+        return sim
+
+    def metrics(self, key: str) -> Optional[Dict[str, float]]:
+        """Solo las métricas de una entrada (sirve también para las guardadas sin detalle)."""
+        run = self.get(key)
+        if run is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dict(run.metrics)
+
+    def put_metrics(self, key: str, metrics: Dict[str, float]):
+        # No pisa una entrada con detalle
+        if self.get(key) is None:
+            self.put(key, CachedRun(None, dict(metrics)))
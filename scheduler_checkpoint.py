@@ -0,0 +1,155 @@
+# scheduler_checkpoint.py
+"""Checkpoints del estado del planificador y reproducción con salto a cualquier tick.
+
+Un checkpoint guarda solo el estado dinámico: reloj, colas de listos en su orden,
+procesos en CPU, procesos vivos (llegados y sin terminar, con su tiempo restante,
+quantum consumido y E/S) y el estado de la política. Lo que no cambia se comparte
+con el simulador original por referencia (persistent_id de pickle): la línea de
+tiempo (basta recordar cuántos eventos llevaba), la lista de procesos (los que aún
+no han llegado se reconstruyen con clone_for_sim) y la de terminados, que solo crece
+(basta su longitud). Así cada checkpoint ocupa O(procesos vivos), no O(carga).
+seek(t) restaura el checkpoint anterior más cercano y avanza hasta `t`.
+"""
+import io, pickle
+from bisect import bisect_right
+from operator import attrgetter
+from typing import List, NamedTuple
+
+FORMAT_VERSION = 2
+
+class Checkpoint(NamedTuple):
+    time: int
+    events: int     # eventos de la línea de tiempo registrados hasta `time`
+    blob: bytes
+
+class _Pickler(pickle.Pickler):
+    # Los objetos de `shared` no se copian: se sustituyen por su nombre
+    def __init__(self, f, shared):
+        super().__init__(f, pickle.HIGHEST_PROTOCOL)
+        self._shared = {id(obj): name for name, obj in shared.items() if obj is not None}
+
+    def persistent_id(self, obj):
+        return self._shared.get(id(obj))
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, f, shared):
+        super().__init__(f)
+        self._shared = shared
+
+    def persistent_load(self, pid):
+        return self._shared[pid]
+
+def snapshot(sim) -> bytes:
+    """Estado completo de `sim`, salvo su línea de tiempo."""
+    buf = io.BytesIO()
+    try:
+        _Pickler(buf, {"timeline": sim.timeline}).dump(sim)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        # Típicamente una carga leída de un generador, que no se puede serializar
+        raise ValueError(f"No se puede guardar el estado de la simulación: {e}") from None
+    return buf.getvalue()
+
+def restore(blob: bytes, timeline):
+    """Simulador independiente a partir de `snapshot`, que registrará en `timeline`."""
+    return _Unpickler(io.BytesIO(blob), {"timeline": timeline}).load()
+
+def _cursor(sim) -> int:
+    # Procesos ya sacados del iterador de llegadas (el pendiente incluido)
+    red = sim._arrivals.__reduce__()
+    return red[2] if len(red) > 2 else len(sim.processes)
+
+def _compact(sim, done: int) -> bytes:
+    """Estado dinámico de `sim`; los procesos de índice < `done` ya han terminado."""
+    procs = sim.processes
+    if procs is None:
+        raise ValueError("No se puede guardar el estado de la simulación: la carga es un iterador")
+    end = _cursor(sim)
+    live = [p for p in procs[done:end] if p.completion_time is None]
+    shared = {"timeline": sim.timeline, "processes": procs, "finished": sim.finished, "arrivals": sim._arrivals}
+    buf = io.BytesIO()
+    _Pickler(buf, shared).dump((sim, done, end, len(sim.finished), live))
+    return buf.getvalue()
+
+def _expand(blob: bytes, timeline, origin):
+    """Simulador independiente a partir de `_compact`, con la carga y los terminados de `origin`."""
+    procs = []
+    shared = {"timeline": timeline, "processes": procs, "finished": None, "arrivals": None}
+    sim, done, end, nfinished, live = _Unpickler(io.BytesIO(blob), shared).load()
+    # Terminados: los mismos objetos (ya no cambian); vivos: la copia; por llegar: clones nuevos
+    live_by_pid = {p.pid: p for p in live}
+    src = origin.processes
+    procs.extend(src[:done])
+    procs.extend(live_by_pid.get(p.pid, p) for p in src[done:end])
+    procs.extend(p.clone_for_sim() for p in src[end:])
+    sim.finished = origin.finished[:nfinished]
+    sim._arrivals = iter(procs)
+    sim._arrivals.__setstate__(end)
+    return sim
+
+class Checkpointer:
+    """Ejecuta una simulación guardando un checkpoint cada `every` ticks simulados.
+
+    En modo por eventos el checkpoint se toma en el primer paso que cruza cada múltiplo.
+    Cada checkpoint cuesta O(procesos vivos), así que `every` fija sobre todo el coste
+    de seek (ticks a resimular desde el checkpoint anterior).
+    """
+    def __init__(self, sim, every: int = 10000):
+        if every <= 0:
+            raise ValueError("El intervalo entre checkpoints debe ser > 0")
+        self.sim = sim
+        self.every = every
+        self.checkpoints: List[Checkpoint] = []
+        self._next = sim.time
+        self._done = 0      # los procesos anteriores a este índice ya terminaron
+
+    def checkpoint(self):
+        sim = self.sim
+        if self.checkpoints and self.checkpoints[-1].time == sim.time:
+            return
+        if sim.processes is not None:
+            procs, i = sim.processes, self._done
+            while i < len(procs) and procs[i].completion_time is not None:
+                i += 1
+            self._done = i
+        self.checkpoints.append(Checkpoint(sim.time, len(sim.timeline.times), _compact(sim, self._done)))
+
+    def step(self, max_time=None) -> bool:
+        if self.sim.time >= self._next:
+            self.checkpoint()
+            self._next = (self.sim.time // self.every + 1) * self.every
+        return self.sim.step(max_time)
+
+    def run(self, max_time=None):
+        while self.step(max_time):
+            pass
+        self.checkpoint()
+        return self.sim._compute_metrics()
+
+    def seek(self, t: int):
+        """Copia del simulador detenida en el tick `t` (o al terminar, si acaba antes)."""
+        if not self.checkpoints:
+            raise ValueError("No hay checkpoints: ejecuta antes run()")
+        i = max(0, bisect_right(self.checkpoints, t, key=attrgetter("time")) - 1)
+        cp = self.checkpoints[i]
+        sim = _expand(cp.blob, self.sim.timeline.head(cp.events, cp.time), self.sim)
+        while sim.time < t and sim.step(t):
+            pass
+        return sim
+
+    def save(self, path: str):
+        """Guarda en binario la línea de tiempo, el estado final (completo) y los checkpoints."""
+        doc = {"version": FORMAT_VERSION, "every": self.every, "timeline": self.sim.timeline,
+               "final": snapshot(self.sim), "checkpoints": [tuple(cp) for cp in self.checkpoints]}
+        with open(path, "wb") as f:
+            pickle.dump(doc, f, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpointer":
+        """Carga una ejecución guardada con save (usa pickle: solo archivos de confianza)."""
+        with open(path, "rb") as f:
+            doc = pickle.load(f)
+        if doc.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Versión de archivo no soportada: {doc.get('version')!r}")
+        cp = cls(restore(doc["final"], doc["timeline"]), doc["every"])
+        cp.checkpoints = [Checkpoint(*c) for c in doc["checkpoints"]]
+        return cp
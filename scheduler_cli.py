@@ -0,0 +1,134 @@
+# scheduler_cli.py
+"""Ejecución sin interfaz gráfica: python -m scheduler_sim traza.csv -a RR -q 2"""
+import argparse, csv, json, sys
+from typing import Dict, List
+from scheduler_sim import Scheduler
+from scheduler_policies import make_policy
+from scheduler_smp import SmpScheduler, QUEUE_MODES
+from scheduler_trace import read_trace
+from scheduler_timeline import OVERHEAD
+from scheduler_checkpoint import Checkpointer
+from scheduler_profile import Profiler
+
+PROCESS_FIELDS = ("pid", "name", "arrival_time", "burst_time", "start_time", "completion_time",
+                  "waiting_time", "turnaround_time", "response_time", "io_time")
+
+def write_table(rows: List[Dict], fmt: str, out=sys.stdout):
+    if fmt == "json":
+        json.dump(rows, out, indent=2)
+        out.write("\n")
+    elif rows:
+        w = csv.DictWriter(out, fieldnames=list(rows[0]))
+        w.writeheader()
+        w.writerows(rows)
+
+def timeline_rows(sim: Scheduler, kind: str) -> List[Dict]:
+    if kind == "events":
+        return [dict(zip(("t", "event", "pid", "cpu"), e)) for e in sim.timeline.events()]
+    cell = lambda r: "-" if r is None else "cs" if r == OVERHEAD else str(r)
+    fmt = lambda run: " ".join(map(cell, run)) if isinstance(run, tuple) else "cs" if run == OVERHEAD else run
+    return [{"t": t, "run": fmt(run), "ready": " ".join(map(str, ready)), "done": " ".join(map(str, done))}
+            for t, run, ready, done in sim.timeline.rows()]
+
+def build_parser():
+    ap = argparse.ArgumentParser(prog="scheduler_sim", description="Simulador de planificación sin interfaz gráfica")
+    ap.add_argument("workload", help="traza CSV/JSONL con name,burst,arrival[,quantum,priority,bursts]")
+    ap.add_argument("-a", "--algorithm", default="FCFS")
+    ap.add_argument("-q", "--quantum", type=int, default=None, help="quantum global (RR) o base de MLFQ")
+    ap.add_argument("--aging", type=int, default=None, help="PRIO/PRIO-P: ticks de espera por nivel de envejecimiento")
+    ap.add_argument("--levels", type=int, default=None, help="MLFQ: número de niveles")
+    ap.add_argument("--quanta", default=None, help="MLFQ: quantum por nivel, p. ej. 2,4,8")
+    ap.add_argument("--boost", type=int, default=None, help="MLFQ: periodo de boost al nivel 0")
+    ap.add_argument("--cpus", type=int, default=1, help="número de CPU (SMP si es > 1)")
+    ap.add_argument("--queues", choices=QUEUE_MODES, default="per-cpu", help="SMP: colas por CPU o global")
+    ap.add_argument("--balance", choices=("steal", "push"), default=None, help="SMP: balanceo de colas por CPU")
+    ap.add_argument("--balance-interval", type=int, default=10, help="SMP: periodo del balanceo push")
+    ap.add_argument("--io-devices", type=int, default=1, help="dispositivos de E/S (procesos con bursts)")
+    ap.add_argument("--switch-cost", type=int, default=0, help="ticks por cambio de contexto")
+    ap.add_argument("--warmup-cost", type=int, default=0, help="ticks extra al reanudar un proceso (caché fría)")
+    ap.add_argument("--max-time", type=int, default=None)
+    ap.add_argument("--tick", action="store_true", help="avanzar tick a tick en lugar de por eventos")
+    ap.add_argument("--save-run", default=None, help="guardar la ejecución con checkpoints (binario)")
+    ap.add_argument("--checkpoint-every", type=int, default=10000, help="ticks entre checkpoints de --save-run")
+    ap.add_argument("--profile", action="store_true",
+                    help="medir el tiempo por fase del motor y contar selecciones y expropiaciones")
+    ap.add_argument("--profile-out", default=None, help="activar cProfile y guardar su perfil (pstats)")
+    ap.add_argument("-f", "--format", choices=("json", "csv"), default="json")
+    ap.add_argument("-o", "--output", default="-", help="archivo de métricas (por defecto stdout)")
+    ap.add_argument("--processes", action="store_true", help="incluir la tabla de procesos terminados")
+    ap.add_argument("--timeline", choices=("events", "rows"), default=None,
+                    help="incluir la línea de tiempo como eventos o como filas por tick")
+    ap.add_argument("--timeline-out", default=None, help="archivo aparte para la línea de tiempo")
+    return ap
+
+def _open(path: str):
+    return sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+
+def policy_options(args) -> Dict:
+    opts = {"aging": args.aging, "levels": args.levels, "boost": args.boost,
+            "quanta": [int(x) for x in args.quanta.split(",")] if args.quanta else None}
+    return {k: v for k, v in opts.items() if v is not None}
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    profiling = args.profile or args.profile_out
+    if profiling and args.save_run:
+        print("error: --profile no es compatible con --save-run", file=sys.stderr)
+        return 2
+    try:
+        opts = policy_options(args)
+        # Los checkpoints necesitan una carga serializable: la traza se lee entera
+        workload = list(read_trace(args.workload)) if args.save_run else read_trace(args.workload)
+        if args.cpus > 1:
+            sim = SmpScheduler(workload, args.algorithm, cpus=args.cpus, rr_quantum=args.quantum,
+                               queues=args.queues, balance=args.balance, balance_interval=args.balance_interval,
+                               event_driven=not args.tick, io_devices=args.io_devices,
+                               switch_cost=args.switch_cost, warmup_cost=args.warmup_cost, **opts)
+        else:
+            sim = Scheduler(workload, make_policy(args.algorithm, args.quantum, **opts),
+                            event_driven=not args.tick, io_devices=args.io_devices,
+                            switch_cost=args.switch_cost, warmup_cost=args.warmup_cost)
+        if args.save_run:
+            cp = Checkpointer(sim, args.checkpoint_every)
+            metrics = cp.run(args.max_time)
+            cp.save(args.save_run)
+        elif profiling:
+            with Profiler(sim, cprofile=bool(args.profile_out)) as prof:
+                metrics = sim.simulate(args.max_time)
+            if args.profile_out: prof.dump(args.profile_out)
+        else:
+            metrics = sim.simulate(args.max_time)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    result = {"algorithm": sim.algorithm, "quantum": sim.rr_quantum, "cpus": args.cpus, "time": sim.time, **metrics}
+    procs = [{f: getattr(p, f) for f in PROCESS_FIELDS} for p in sorted(sim.finished, key=lambda p: p.pid)]
+    timeline = timeline_rows(sim, args.timeline) if args.timeline else None
+    report = prof.report() if profiling else None
+    out = _open(args.output)
+    try:
+        if args.format == "json":
+            doc = {"metrics": result}
+            if args.processes: doc["processes"] = procs
+            if timeline is not None and not args.timeline_out: doc["timeline"] = timeline
+            if report is not None: doc["profile"] = report
+            json.dump(doc, out, indent=2)
+            out.write("\n")
+        else:
+            write_table([result], "csv", out)
+            if args.processes:
+                out.write("\n")
+                write_table(procs, "csv", out)
+            if timeline is not None and not args.timeline_out:
+                out.write("\n")
+                write_table(timeline, "csv", out)
+    finally:
+        if out is not sys.stdout: out.close()
+    if report is not None and args.format == "csv":
+        # En CSV el perfil no cabe en la tabla: va a stderr como JSON
+        json.dump(report, sys.stderr, indent=2)
+        sys.stderr.write("\n")
+    if timeline is not None and args.timeline_out:
+        with _open(args.timeline_out) as f:
+            write_table(timeline, args.format, f)
+    return 0
@@ -0,0 +1,52 @@
+# scheduler_io.py
+from collections import deque
+from typing import List, Optional
+
+class IoDevices:
+    """Dispositivos de E/S idénticos que atienden una cola de bloqueados FIFO común.
+
+    Avanzan a la vez que la CPU: advance(span) descuenta `span` ticks a cada
+    dispositivo ocupado y devuelve los procesos cuya ráfaga de E/S terminó.
+    """
+    def __init__(self, n: int = 1):
+        if n < 1:
+            raise ValueError("Se necesita al menos un dispositivo de E/S")
+        self.blocked = deque()                  # (proceso, duración) en espera de dispositivo
+        self.slots: List[Optional[list]] = [None] * n   # [proceso, ticks restantes]
+        self.busy = [0] * n
+        self.n = 0          # procesos en el subsistema de E/S (en cola o en dispositivo)
+
+    def __len__(self):
+        return len(self.slots)
+
+    def has_work(self) -> bool:
+        return self.n > 0
+
+    def block(self, p, duration: int):
+        self.blocked.append((p, duration))
+        self.n += 1
+
+    def start(self):
+        if not self.blocked: return
+        for i, s in enumerate(self.slots):
+            if s is None:
+                p, d = self.blocked.popleft()
+                self.slots[i] = [p, d]
+                if not self.blocked: return
+
+    def next_event(self) -> Optional[int]:
+        """Ticks hasta que termine la primera E/S en curso (None si no hay ninguna)."""
+        left = [s[1] for s in self.slots if s is not None]
+        return min(left) if left else None
+
+    def advance(self, span: int) -> list:
+        done = []
+        for i, s in enumerate(self.slots):
+            if s is None: continue
+            s[1] -= span
+            self.busy[i] += span
+            if s[1] == 0:
+                done.append(s[0])
+                self.slots[i] = None
+        self.n -= len(done)
+        return done
@@ -0,0 +1,56 @@
+# scheduler_metrics.py
+from array import array
+from typing import Dict, Iterable, Optional, Sequence
+
+METRICS = ("waiting", "turnaround", "response")
+PERCENTILES = (50, 95, 99)
+
+def percentile(sorted_vals, q: float) -> float:
+    """Percentil con interpolación lineal sobre una secuencia ya ordenada."""
+    if not sorted_vals:
+        return 0.0
+    pos = (len(sorted_vals) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (pos - lo)
+
+def summarize(name: str, vals) -> Dict[str, float]:
+    vals = sorted(vals)
+    out = {f"avg_{name}": sum(vals) / len(vals) if vals else 0.0}
+    for q in PERCENTILES:
+        out[f"p{q}_{name}"] = percentile(vals, q)
+    out[f"max_{name}"] = vals[-1] if vals else 0
+    return out
+
+def compute_metrics(finished: Iterable, makespan: int, busy: int,
+                    per_cpu: Optional[Sequence[int]] = None,
+                    io_busy: Optional[Sequence[int]] = None,
+                    switches: int = 0, overhead: int = 0) -> Dict[str, float]:
+    """Espera, retorno y respuesta (media, p50/p95/p99, máximo), throughput y uso de CPU.
+
+    Recorre los procesos terminados una sola vez volcando cada métrica en un array.
+    Con `per_cpu` (ticks ocupados de cada CPU) el uso global se normaliza por el
+    número de CPU y se añade cpuN_utilization para cada una. Con `io_busy` se añade
+    lo mismo para los dispositivos de E/S (io_utilization e ioN_utilization).
+    `overhead` son los ticks de CPU gastados en cambios de contexto.
+    """
+    cols = {m: array("q") for m in METRICS}
+    w, t, r = cols["waiting"].append, cols["turnaround"].append, cols["response"].append
+    for p in finished:
+        w(p.waiting_time); t(p.turnaround_time); r(p.response_time)
+    out: Dict[str, float] = {}
+    for m in METRICS:
+        out.update(summarize(m, cols[m]))
+    n = len(cols["waiting"])
+    out["throughput"] = n / makespan if makespan else 0.0
+    ncpu = len(per_cpu) if per_cpu else 1
+    out["cpu_utilization"] = busy / (makespan * ncpu) if makespan else 0.0
+    for i, b in enumerate(per_cpu or ()):
+        out[f"cpu{i}_utilization"] = b / makespan if makespan else 0.0
+    out["context_switches"] = switches
+    out["overhead_fraction"] = overhead / (makespan * ncpu) if makespan else 0.0
+    if io_busy:
+        out["io_utilization"] = sum(io_busy) / (makespan * len(io_busy)) if makespan else 0.0
+        for i, b in enumerate(io_busy):
+            out[f"io{i}_utilization"] = b / makespan if makespan else 0.0
+    return out
@@ -0,0 +1,168 @@
+# scheduler_montecarlo.py
+"""Réplicas Monte Carlo: muchas cargas sintéticas con semillas independientes y un IC por métrica.
+
+Cada réplica genera su carga con scheduler_workload (semilla derivada de `seed` y
+de su índice con un hash, así que experimentos con semillas base cercanas no
+comparten réplicas) y la simula por eventos. Las réplicas se lanzan en rondas de `batch` sobre un pool de procesos
+que se reutiliza entre rondas y entre llamadas; tras cada ronda se calcula el
+intervalo de confianza (t de Student) y se para al alcanzar la semianchura pedida.
+Como las rondas tienen tamaño fijo, el resultado no depende del número de workers.
+
+    python scheduler_montecarlo.py -a RR -q 4 --metric avg_waiting --target 0.5 -j 8
+"""
+import argparse, hashlib, json, math, os, statistics, sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from scheduler_sim import Scheduler
+from scheduler_smp import SmpScheduler
+from scheduler_policies import make_policy
+from scheduler_workload import generate
+
+def t_quantile(p: float, df: int) -> float:
+    """Cuantil `p` de la t de Student con `df` grados de libertad (desarrollo de Cornish-Fisher).
+
+    Error relativo < 1 % para df >= 3; para df < 3 se usan los valores exactos.
+    """
+    if df < 1:
+        raise ValueError("Se necesitan al menos 2 muestras")
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        a = 4 * p * (1 - p)
+        return (2 * p - 1) * math.sqrt(2 / a)
+    z = statistics.NormalDist().inv_cdf(p)
+    z2 = z * z
+    g1 = (z2 + 1) * z / 4
+    g2 = ((5 * z2 + 16) * z2 + 3) * z / 96
+    g3 = (((3 * z2 + 19) * z2 + 17) * z2 - 15) * z / 384
+    g4 = ((((79 * z2 + 776) * z2 + 1482) * z2 - 1920) * z2 - 945) * z / 92160
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+
+def confidence_interval(samples: List[float], confidence: float = 0.95) -> Tuple[float, float]:
+    """(media, semianchura) del intervalo de confianza de la media."""
+    n = len(samples)
+    mean = statistics.fmean(samples)
+    if n < 2:
+        return mean, math.inf
+    return mean, t_quantile((1 + confidence) / 2, n - 1) * statistics.stdev(samples) / math.sqrt(n)
+
+def replication_seed(seed: int, i: int) -> int:
+    """Semilla de 64 bits de la réplica `i` de un experimento con semilla base `seed`."""
+    return int.from_bytes(hashlib.blake2b(f"{seed}:{i}".encode(), digest_size=8).digest(), "big")
+
+def run_replication(task: Tuple) -> Dict[str, float]:
+    """Una réplica: (índice, semilla, algoritmo, quantum, opciones de política, de carga y de Scheduler)."""
+    i, seed, algorithm, rr_quantum, policy_options, workload, config = task
+    procs = list(generate(workload.get("n", 200), seed, **{k: v for k, v in workload.items() if k != "n"}))
+    cfg = dict(config)
+    cpus = cfg.pop("cpus", 1)
+    if cpus > 1:
+        sim = SmpScheduler(procs, algorithm, cpus=cpus, rr_quantum=rr_quantum, event_driven=True,
+                           **cfg, **policy_options)
+    else:
+        sim = Scheduler(procs, make_policy(algorithm, rr_quantum, **policy_options), event_driven=True, **cfg)
+    return sim.simulate()
+
+class Replicator:
+    """Pool de workers reutilizable para lanzar réplicas (úsese como gestor de contexto)."""
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _map(self, tasks: List[Tuple]) -> List[Dict[str, float]]:
+        if self._pool is None:
+            return [run_replication(t) for t in tasks]
+        return list(self._pool.map(run_replication, tasks))
+
+    def run(self, algorithm: str, rr_quantum: Optional[int] = None, metric: str = "avg_waiting",
+            target: Optional[float] = None, relative: bool = False, confidence: float = 0.95,
+            min_reps: int = 10, max_reps: int = 1000, batch: int = 16, seed: int = 0,
+            workload: Optional[Dict] = None, policy_options: Optional[Dict] = None, **config) -> Dict:
+        """Replica hasta que la semianchura del IC de `metric` sea <= `target` o se llegue a `max_reps`.
+
+        Con `relative`, `target` es una fracción de la media. `workload` son opciones de
+        scheduler_workload.generate más `n` (procesos por réplica); `config`, argumentos de
+        Scheduler/SmpScheduler. Devuelve media, IC, número de réplicas y la media de cada métrica.
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("La confianza debe estar en (0, 1)")
+        if not 2 <= min_reps <= max_reps or batch < 1:
+            raise ValueError("Se necesita 2 <= min_reps <= max_reps y batch >= 1")
+        if target is not None and target <= 0:
+            raise ValueError("La semianchura objetivo debe ser > 0")
+        workload, opts = dict(workload or {}), dict(policy_options or {})
+        rows: List[Dict[str, float]] = []
+        samples: List[float] = []
+        mean, half = math.nan, math.inf
+        while len(rows) < max_reps:
+            # La primera ronda llega al mínimo de réplicas; el resto, de `batch` en `batch`
+            size = max(batch, min_reps - len(rows)) if rows else max(batch, min_reps)
+            size = min(size, max_reps - len(rows))
+            base = len(rows)
+            tasks = [(i, replication_seed(seed, i), algorithm, rr_quantum, opts, workload, config) for i in range(base, base + size)]
+            for r in self._map(tasks):
+                if metric not in r:
+                    raise ValueError(f"Métrica desconocida: {metric!r}")
+                rows.append(r)
+                samples.append(r[metric])
+            mean, half = confidence_interval(samples, confidence)
+            if target is not None and len(rows) >= min_reps:
+                if half <= (target * abs(mean) if relative else target):
+                    break
+        converged = target is not None and half <= (target * abs(mean) if relative else target)
+        means = {k: statistics.fmean(r[k] for r in rows) for k in rows[0]}
+        return {"algorithm": algorithm.upper(), "quantum": rr_quantum, "metric": metric, "replications": len(rows),
+                "mean": mean, "half_width": half, "low": mean - half, "high": mean + half,
+                "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+                "confidence": confidence, "converged": converged, "means": means}
+
+def replicate(algorithm: str, rr_quantum: Optional[int] = None, workers: Optional[int] = None, **kw) -> Dict:
+    """Atajo de Replicator.run con un pool de un solo uso."""
+    with Replicator(workers) as rep:
+        return rep.run(algorithm, rr_quantum, **kw)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Réplicas Monte Carlo con intervalo de confianza")
+    ap.add_argument("-a", "--algorithm", default="RR")
+    ap.add_argument("-q", "--quantum", type=int, default=None)
+    ap.add_argument("--metric", default="avg_waiting")
+    ap.add_argument("--target", type=float, default=None, help="semianchura del IC a alcanzar")
+    ap.add_argument("--relative", action="store_true", help="--target como fracción de la media")
+    ap.add_argument("--confidence", type=float, default=0.95)
+    ap.add_argument("--min-reps", type=int, default=10)
+    ap.add_argument("--max-reps", type=int, default=1000)
+    ap.add_argument("--batch", type=int, default=16, help="réplicas por ronda entre comprobaciones")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("-j", "--workers", type=int, default=None)
+    ap.add_argument("-n", "--processes", type=int, default=200, help="procesos por réplica")
+    ap.add_argument("--rate", type=float, default=0.15)
+    ap.add_argument("--arrivals", default="poisson")
+    ap.add_argument("--bursts", default="exponential")
+    ap.add_argument("--mean-burst", type=float, default=5.0)
+    args = ap.parse_args(argv)
+    workload = {"n": args.processes, "rate": args.rate, "arrivals": args.arrivals,
+                "bursts": args.bursts, "mean_burst": args.mean_burst}
+    try:
+        out = replicate(args.algorithm, args.quantum, args.workers, metric=args.metric, target=args.target,
+                        relative=args.relative, confidence=args.confidence, min_reps=args.min_reps,
+                        max_reps=args.max_reps, batch=args.batch, seed=args.seed, workload=workload)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    json.dump(out, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+# scheduler_policies.py
+"""Políticas de planificación enchufables.
+
+El motor enlaza la política una sola vez y llama a sus ganchos: on_arrive al
+llegar un proceso, select en cada despacho, on_tick tras ejecutar un tramo,
+on_preempt cuando el proceso en CPU se retira sin terminar, on_block cuando
+deja la CPU para hacer E/S (al volver pasa otra vez por on_arrive) y
+on_complete cuando termina. Con varias colas (SMP), migrate pasa un proceso ya
+sacado de la cola a la política de otra CPU junto con su estado por proceso. Cada instancia
+guarda su propia cola de listos, así que sirve para una sola simulación.
+
+Si la simulación cobra cambios de contexto, el motor no consulta select mientras
+dura el cambio ni en el primer tick del proceso recién despachado: esa ventana no
+es expropiable. Las políticas expropiativas deberían además no expropiar cuando lo
+que se gana no compensa el coste (ver switch_cost).
+Para añadir una política basta con heredar de Policy y decorarla con @register.
+"""
+import inspect
+from operator import attrgetter
+from typing import Callable, Dict, Optional, Sequence, Type
+from scheduler_queues import ReadyQueue, FifoReadyQueue, LevelReadyQueue, by_burst, by_remaining
+
+class Policy:
+    name = ""
+    preemptive = False      # select se consulta aunque la CPU esté ocupada
+    needs_quantum = False
+    queue_factory: Callable[[], ReadyQueue] = FifoReadyQueue
+
+    def __init__(self, quantum: Optional[int] = None):
+        self.quantum = quantum
+        self.sim = None
+        self.ready: ReadyQueue = self.queue_factory()
+
+    def bind(self, sim):
+        """Lo llama Scheduler al crearse; da acceso al reloj simulado (sim.time)."""
+        self.sim = sim
+
+    def on_arrive(self, p):
+        self.ready.push(p)
+
+    def switch_cost(self) -> int:
+        """Ticks que cuesta en el peor caso cambiar de proceso en la CPU (0 = gratis)."""
+        sim = self.sim
+        return sim.switch_cost + sim.warmup_cost if sim else 0
+
+    def select(self, running):
+        """Proceso que debe ocupar la CPU a continuación (puede ser `running`)."""
+        return running if running is not None else self.ready.pop()
+
+    def on_tick(self, p, span: int):
+        pass
+
+    def on_preempt(self, p):
+        self.ready.push(p)
+
+    def on_block(self, p):
+        pass
+
+    def on_complete(self, p):
+        pass
+
+    def migrate(self, p, dst: "Policy"):
+        """Entrega `p` (fuera de la cola y de la CPU) a `dst`, que puede ser esta misma política."""
+        dst.on_arrive(p)
+
+    def slice_left(self, p) -> Optional[int]:
+        """Ticks que `p` puede ejecutar antes de que la política lo retire (None = sin límite)."""
+        return None
+
+    def horizon(self, running) -> Optional[int]:
+        """Ticks hasta que select cambiaría de decisión sin nuevas llegadas (None = nunca).
+
+        El motor por eventos no salta más allá de este punto.
+        """
+        return None
+
+POLICIES: Dict[str, Type[Policy]] = {}
+
+def register(cls: Type[Policy]) -> Type[Policy]:
+    POLICIES[cls.name.upper()] = cls
+    return cls
+
+def make_policy(name: str, quantum: Optional[int] = None, **options) -> Policy:
+    cls = POLICIES.get(name.upper())
+    if cls is None:
+        raise ValueError("Algoritmo inválido")
+    try:
+        inspect.signature(cls).bind(quantum, **options)
+    except TypeError as e:
+        raise ValueError(f"{cls.name}: {e}") from None
+    return cls(quantum, **options)
+
+@register
+class FCFS(Policy):
+    name = "FCFS"
+
+@register
+class SJF(Policy):
+    name = "SJF"
+    queue_factory = staticmethod(by_burst)
+
+@register
+class SRTF(Policy):
+    name = "SRTF"
+    preemptive = True
+    queue_factory = staticmethod(by_remaining)
+
+    def select(self, running):
+        best = self.ready.peek()
+        if best is None: return running
+        if running is not None:
+            # Sin coste de cambio, en empate gana el de la cola (igual que min() sobre
+            # ready + [running]); con coste solo se expropia si se ahorra más que el cambio
+            gain = running.remaining_time - best.remaining_time
+            cost = self.switch_cost()
+            if gain < 0 or (cost and gain <= cost): return running
+        self.ready.pop()
+        if running is not None: self.ready.push(running)
+        return best
+
+@register
+class RoundRobin(Policy):
+    name = "RR"
+    needs_quantum = True
+
+    def __init__(self, quantum: Optional[int] = None):
+        if quantum is None:
+            raise ValueError("Round Robin requiere quantum")
+        super().__init__(quantum)
+
+    def select(self, running):
+        if running is not None: return running
+        p = self.ready.pop()
+        if p is not None and p._rr_slice_left is None:
+            p._rr_slice_left = p.quantum or self.quantum
+        return p
+
+    def on_tick(self, p, span):
+        p._rr_slice_left -= span
+
+    def on_preempt(self, p):
+        p._rr_slice_left = p.quantum or self.quantum
+        self.ready.push(p)
+
+    def on_block(self, p):
+        p._rr_slice_left = None
+
+    def slice_left(self, p):
+        return p._rr_slice_left
+
+@register
+class Priority(Policy):
+    """Prioridad no expropiativa (menor número = más urgente) con envejecimiento opcional.
+
+    Con `aging`, cada `aging` ticks de espera mejoran en 1 la prioridad efectiva. Como
+    cada nivel es FIFO, el primero de cada nivel es el que más ha esperado, así que
+    basta comparar las cabezas de los niveles ocupados.
+    """
+    name = "PRIO"
+
+    def __init__(self, quantum: Optional[int] = None, aging: Optional[int] = None):
+        if aging is not None and aging <= 0:
+            raise ValueError("El intervalo de envejecimiento debe ser > 0")
+        self.aging = aging
+        super().__init__(quantum)
+
+    def queue_factory(self):
+        return LevelReadyQueue(attrgetter("priority"), clock=self._now)
+
+    def _now(self) -> int:
+        return self.sim.time if self.sim else 0
+
+    def _best(self):
+        """(prioridad efectiva, nivel) del mejor proceso en espera; a igualdad, el más antiguo."""
+        if self.aging is None:
+            lvl = self.ready.best_level()
+            return lvl, lvl
+        now, aging = self._now(), self.aging
+        best = min((lvl - (now - t) // aging, seq, lvl) for lvl, t, seq, _ in self.ready.heads())
+        return best[0], best[2]
+
+    def select(self, running):
+        if running is not None or not self.ready: return running
+        return self.ready.pop_level(self._best()[1])
+
+@register
+class PreemptivePriority(Priority):
+    name = "PRIO-P"
+    preemptive = True
+
+    def select(self, running):
+        if not self.ready: return running
+        eff, lvl = self._best()
+        # A igual prioridad el proceso en CPU la conserva
+        if running is not None and running.priority <= eff: return running
+        p = self.ready.pop_level(lvl)
+        if running is not None: self.ready.push(running)
+        return p
+
+    def horizon(self, running):
+        # Instante en que alguna cabeza envejece por debajo de la prioridad del que ejecuta
+        if running is None or self.aging is None or not self.ready: return None
+        r = running.priority
+        due = min(t + (lvl - r + 1) * self.aging for lvl, t, _, _ in self.ready.heads())
+        return max(1, due - self._now())
+
+@register
+class MLFQ(Policy):
+    """Cola multinivel con realimentación.
+
+    Los procesos entran al nivel 0; agotar el quantum del nivel los baja uno (el último
+    nivel es Round Robin). Un nivel superior ocupado expropia al de uno inferior, que
+    conserva nivel y el resto de su quantum. Cada `boost` ticks todos vuelven al nivel 0.
+    Por defecto hay `levels` niveles con quantum, 2·quantum, 4·quantum...
+    """
+    name = "MLFQ"
+    preemptive = True
+    needs_quantum = True
+
+    def __init__(self, quantum: Optional[int] = None, levels: int = 3,
+                 quanta: Optional[Sequence[int]] = None, boost: Optional[int] = None):
+        if quanta is None:
+            if quantum is None:
+                raise ValueError("MLFQ requiere quantum o quanta por nivel")
+            quanta = [quantum * 2 ** i for i in range(levels)]
+        if not quanta or min(quanta) <= 0:
+            raise ValueError("Los quanta de MLFQ deben ser > 0")
+        if boost is not None and boost <= 0:
+            raise ValueError("El periodo de boost debe ser > 0")
+        self.quanta = tuple(quanta)
+        self.boost = boost
+        self._level: Dict[int, int] = {}    # pid -> nivel; ausente = nivel 0
+        self._next_boost = boost
+        super().__init__(self.quanta[0] if quantum is None else quantum)
+
+    def queue_factory(self):
+        return LevelReadyQueue(self._level_of)
+
+    def _level_of(self, p) -> int:
+        return self._level.get(p.pid, 0)
+
+    def _boost(self, running):
+        now = self.sim.time
+        waiting = self.ready.drain()
+        self._level.clear()
+        for p in waiting:
+            p._rr_slice_left = None
+            self.ready.push(p)
+        if running is not None:
+            running._rr_slice_left = self.quanta[0]
+        self._next_boost = (now // self.boost + 1) * self.boost
+
+    def select(self, running):
+        if self._next_boost is not None and self.sim.time >= self._next_boost:
+            self._boost(running)
+        lvl = self.ready.best_level()
+        if running is not None:
+            if lvl is None or lvl >= self._level.get(running.pid, 0): return running
+            self.ready.push(running)
+        p = self.ready.pop()
+        if p is not None and p._rr_slice_left is None:
+            p._rr_slice_left = self.quanta[self._level.get(p.pid, 0)]
+        return p
+
+    def on_tick(self, p, span):
+        p._rr_slice_left -= span
+
+    def on_preempt(self, p):
+        # Solo llega aquí al agotar el quantum: baja un nivel
+        lvl = min(self._level.get(p.pid, 0) + 1, len(self.quanta) - 1)
+        self._level[p.pid] = lvl
+        p._rr_slice_left = self.quanta[lvl]
+        self.ready.push(p)
+
+    def on_block(self, p):
+        # Ceder la CPU antes de agotar el quantum conserva el nivel
+        p._rr_slice_left = None
+
+    def on_complete(self, p):
+        self._level.pop(p.pid, None)
+
+    def migrate(self, p, dst):
+        # El nivel viaja con el proceso: migrar no lo devuelve al nivel 0
+        lvl = self._level.pop(p.pid, None)
+        if lvl is not None: dst._level[p.pid] = lvl
+        dst.on_arrive(p)
+
+    def slice_left(self, p):
+        return p._rr_slice_left
+
+    def horizon(self, running):
+        if running is None or self._next_boost is None: return None
+        return max(1, self._next_boost - self.sim.time)
@@ -0,0 +1,197 @@
+# scheduler_profile.py
+"""Instrumentación opcional del motor: tiempo por fase, contadores y gancho de cProfile.
+
+El motor no lleva ninguna comprobación de perfilado: Profiler sustituye, solo en la
+instancia perfilada, los métodos de cada fase del paso (_admit, _rebalance,
+_dispatch, _end_tick, _wake) y el select de sus políticas por envoltorios que miden
+con perf_counter_ns. Sin Profiler el coste es cero; al soltarlo (detach o al salir
+del `with`) la instancia vuelve a usar los métodos de su clase.
+
+    with Profiler(sim) as prof:
+        sim.simulate()
+    print(prof.report())
+
+Las fases no se solapan salvo `select`, que va incluida en `dispatch`; `run` es el
+resto del paso (avance de los procesos, E/S, línea de tiempo). El histograma de la
+cola de listos cuenta ticks con cada longitud (medida al despachar), así que es el
+mismo en modo tick y por eventos.
+"""
+import cProfile, io, pstats
+from collections import Counter
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional
+
+PHASES = ("admit", "balance", "dispatch", "select", "run", "end_tick", "wake")
+# Fase -> método del simulador que la delimita (las que no existen en la instancia se ignoran)
+_METHODS = {"admit": "_admit", "balance": "_rebalance", "dispatch": "_dispatch",
+            "end_tick": "_end_tick", "wake": "_wake"}
+
+class Profiler:
+    """Perfil de un Scheduler o SmpScheduler mientras está enganchado.
+
+    `cprofile` activa además cProfile durante los pasos; `tracer(fase, inicio_ns, dur_ns)`
+    recibe cada tramo medido (para volcarlo, p. ej., a un visor de trazas).
+    Mientras está enganchado el simulador no se puede serializar (checkpoints, caché).
+    """
+    def __init__(self, sim, cprofile: bool = False, tracer: Optional[Callable[[str, int, int], None]] = None):
+        self.sim = sim
+        self.tracer = tracer
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self.ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.calls: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.steps = self.ticks = 0
+        self.selections = self.preemptions = self.expirations = 0
+        self.queue_length: Counter = Counter()
+        self._ql = 0
+        self._policies: List = []
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, *exc):
+        self.detach()
+
+    def _timed(self, phase: str, fn):
+        ns, calls, tracer = self.ns, self.calls, self.tracer
+        if tracer is None:
+            def wrapper(*args):
+                t0 = perf_counter_ns()
+                out = fn(*args)
+                ns[phase] += perf_counter_ns() - t0
+                calls[phase] += 1
+                return out
+        else:
+            def wrapper(*args):
+                t0 = perf_counter_ns()
+                out = fn(*args)
+                dt = perf_counter_ns() - t0
+                ns[phase] += dt
+                calls[phase] += 1
+                tracer(phase, t0, dt)
+                return out
+        return wrapper
+
+    def attach(self) -> "Profiler":
+        if self._policies:
+            raise ValueError("El perfilador ya está enganchado")
+        sim, d = self.sim, self.sim.__dict__
+        self._policies = list(getattr(sim, "policies", None) or [sim.policy])
+        dispatch = sim._dispatch
+        def measured_dispatch():
+            # Longitud de la cola justo antes de elegir (tras las llegadas)
+            self._ql = sum(len(pol.ready) for pol in self._policies)
+            dispatch()
+        d["_dispatch"] = measured_dispatch
+        for phase, name in _METHODS.items():
+            if hasattr(sim, name):
+                d[name] = self._timed(phase, getattr(sim, name))
+        d["step"] = self._step(sim.step)
+        for pol in self._policies:
+            pol.__dict__["select"] = self._select(pol.select)
+            pol.__dict__["on_preempt"] = self._expire(pol.on_preempt)
+        return self
+
+    def detach(self):
+        for name in (*_METHODS.values(), "step"):
+            self.sim.__dict__.pop(name, None)
+        for pol in self._policies:
+            pol.__dict__.pop("select", None)
+            pol.__dict__.pop("on_preempt", None)
+        self._policies = []
+
+    def _select(self, select):
+        timed = self._timed("select", select)
+        def wrapper(running):
+            p = timed(running)
+            self.selections += 1
+            if running is not None and p is not running:
+                self.preemptions += 1
+            return p
+        return wrapper
+
+    def _expire(self, on_preempt):
+        def wrapper(p):
+            self.expirations += 1
+            on_preempt(p)
+        return wrapper
+
+    def _step(self, step):
+        sim, prof, ns, tracer = self.sim, self.cprofile, self.ns, self.tracer
+        def wrapper(max_time=None):
+            t, inner = sim.time, sum(ns.values()) - ns["select"]
+            t0 = perf_counter_ns()
+            if prof: prof.enable()
+            try:
+                more = step(max_time)
+            finally:
+                if prof: prof.disable()
+            dt = perf_counter_ns() - t0
+            if more:
+                span = sim.time - t
+                self.steps += 1
+                self.ticks += span
+                self.queue_length[self._ql] += span
+                run = dt - (sum(ns.values()) - ns["select"] - inner)
+                ns["run"] += run
+                self.calls["run"] += 1
+                if tracer: tracer("run", t0, run)
+            return more
+        return wrapper
+
+    def report(self, top: int = 15) -> Dict:
+        """Tiempos por fase (segundos, llamadas, fracción del total), contadores e histograma.
+
+        `preemptions` son selecciones que desalojan al proceso en CPU; `expirations`, fines
+        de quantum (on_preempt).
+        Con cProfile, `functions` son las `top` funciones con más tiempo acumulado.
+        """
+        total = sum(v for k, v in self.ns.items() if k != "select")
+        phases = {k: {"seconds": v / 1e9, "calls": self.calls[k], "share": v / total if total else 0.0}
+                  for k, v in self.ns.items() if self.calls[k]}
+        out = {"seconds": total / 1e9, "steps": self.steps, "ticks": self.ticks, "phases": phases,
+               "counters": {"selections": self.selections, "preemptions": self.preemptions,
+                            "expirations": self.expirations},
+               "queue_length": dict(sorted(self.queue_length.items()))}
+        if self.cprofile is not None:
+            st = pstats.Stats(self.cprofile).sort_stats("cumulative")
+            rows = []
+            for (file, line, func), (cc, nc, tt, ct, _) in st.stats.items():
+                rows.append({"function": f"{file}:{line}({func})", "calls": nc, "tottime": tt, "cumtime": ct})
+            rows.sort(key=lambda r: -r["cumtime"])
+            out["functions"] = rows[:top]
+        return out
+
+    def stats(self, sort: str = "cumulative", limit: int = 25) -> str:
+        """Salida de pstats en texto (requiere cprofile=True)."""
+        if self.cprofile is None:
+            raise ValueError("Perfilador creado sin cprofile")
+        buf = io.StringIO()
+        pstats.Stats(self.cprofile, stream=buf).sort_stats(sort).print_stats(limit)
+        return buf.getvalue()
+
+    def dump(self, path: str):
+        """Guarda el perfil de cProfile (para pstats, snakeviz...)."""
+        if self.cprofile is None:
+            raise ValueError("Perfilador creado sin cprofile")
+        self.cprofile.dump_stats(path)
+
+def profile(sim, max_time: Optional[int] = None, **options):
+    """Simula `sim` con un Profiler enganchado; devuelve (métricas, perfilador)."""
+    with Profiler(sim, **options) as prof:
+        metrics = sim.simulate(max_time)
+    return metrics, prof
+
+def format_report(rep: Dict) -> str:
+    """Resumen legible de `Profiler.report()` (para la GUI)."""
+    lines = [f"{rep['steps']} pasos, {rep['ticks']} ticks, {rep['seconds'] * 1e3:.1f} ms en el motor"]
+    for name, ph in rep["phases"].items():
+        lines.append(f"  {name:<9}{ph['seconds'] * 1e3:9.2f} ms {ph['share']:6.1%} ({ph['calls']} llamadas)")
+    c = rep["counters"]
+    lines.append(f"Selecciones {c['selections']}, expropiaciones {c['preemptions']}, "
+                 f"fines de quantum {c['expirations']}")
+    hist = rep["queue_length"]
+    if hist:
+        ticks = sum(hist.values())
+        mean = sum(k * v for k, v in hist.items()) / ticks if ticks else 0.0
+        lines.append(f"Cola de listos: media {mean:.2f}, máxima {max(hist)}")
+    return "\n".join(lines)
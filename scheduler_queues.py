@@ -0,0 +1,120 @@
+# scheduler_queues.py
+from collections import deque
+from operator import attrgetter
+from typing import Callable, Iterator, Optional
+import heapq, itertools
+
+class ReadyQueue:
+    """Cola de listos: push/pop/peek; la iteración respeta el orden de llegada a la cola."""
+    def push(self, p): raise NotImplementedError
+    def pop(self): raise NotImplementedError
+    def peek(self): raise NotImplementedError
+    def __len__(self): raise NotImplementedError
+    def __iter__(self) -> Iterator: raise NotImplementedError
+    def __bool__(self): return len(self) > 0
+    # Serialización (checkpoints): el contador de llegadas se guarda como entero
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if "_seq" in state:
+            state["_seq"] = n = next(self._seq)
+            self._seq = itertools.count(n)
+        return state
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "_seq" in state:
+            self._seq = itertools.count(state["_seq"])
+
+class FifoReadyQueue(ReadyQueue):
+    def __init__(self):
+        self._q = deque()
+    def push(self, p):
+        self._q.append(p)
+    def pop(self):
+        return self._q.popleft() if self._q else None
+    def peek(self):
+        return self._q[0] if self._q else None
+    def __len__(self):
+        return len(self._q)
+    def __iter__(self):
+        return iter(self._q)
+
+class HeapReadyQueue(ReadyQueue):
+    """Montículo por clave; a igual clave gana el que entró antes (FIFO)."""
+    def __init__(self, key: Callable):
+        self._key = key
+        self._heap = []
+        self._seq = itertools.count()
+    def push(self, p):
+        heapq.heappush(self._heap, (self._key(p), next(self._seq), p))
+    def pop(self):
+        return heapq.heappop(self._heap)[2] if self._heap else None
+    def peek(self):
+        return self._heap[0][2] if self._heap else None
+    def __len__(self):
+        return len(self._heap)
+    def __iter__(self):
+        return (e[2] for e in sorted(self._heap, key=lambda e: e[1]))
+
+def by_burst():
+    # Ráfaga de CPU actual: al encolar en una política no expropiativa remaining_time es
+    # la ráfaga entera (burst_time solo coincide si el proceso no hace E/S)
+    return HeapReadyQueue(key=attrgetter("remaining_time"))
+
+def by_remaining():
+    return HeapReadyQueue(key=attrgetter("remaining_time"))
+
+class LevelReadyQueue(ReadyQueue):
+    """Una deque FIFO por nivel entero (menor = más urgente) más un montículo de niveles no vacíos.
+
+    push/pop cuestan O(log L) con L niveles ocupados. Cada entrada guarda el instante
+    de encolado (según `clock`) para las políticas con envejecimiento.
+    """
+    def __init__(self, level: Callable, clock: Optional[Callable[[], int]] = None):
+        self._level = level
+        self._clock = clock
+        self._queues = {}
+        self._active = []       # niveles con cola no vacía (sin duplicados)
+        self._seq = itertools.count()
+        self._n = 0
+    def push(self, p):
+        lvl = self._level(p)
+        q = self._queues.get(lvl)
+        if q is None:
+            q = self._queues[lvl] = deque()
+        if not q:
+            heapq.heappush(self._active, lvl)
+        q.append((next(self._seq), self._clock() if self._clock else 0, p))
+        self._n += 1
+    def best_level(self) -> Optional[int]:
+        return self._active[0] if self._active else None
+    def pop_level(self, lvl: int):
+        q = self._queues[lvl]
+        p = q.popleft()[2]
+        self._n -= 1
+        if not q:
+            if lvl == self._active[0]:
+                heapq.heappop(self._active)
+            else:
+                self._active.remove(lvl)
+                heapq.heapify(self._active)
+        return p
+    def pop(self):
+        return self.pop_level(self._active[0]) if self._active else None
+    def peek(self):
+        return self._queues[self._active[0]][0][2] if self._active else None
+    def heads(self) -> Iterator:
+        """(nivel, instante de encolado, seq, proceso) del primero de cada nivel ocupado."""
+        for lvl in self._active:
+            seq, t, p = self._queues[lvl][0]
+            yield lvl, t, seq, p
+    def drain(self) -> list:
+        """Vacía la cola y devuelve los procesos en orden de llegada a ella."""
+        out = [e[2] for e in heapq.merge(*(self._queues[l] for l in self._active))]
+        self._queues.clear()
+        self._active.clear()
+        self._n = 0
+        return out
+    def __len__(self):
+        return self._n
+    def __iter__(self):
+        return (e[2] for e in heapq.merge(*(self._queues[l] for l in self._active)))
@@ -0,0 +1,107 @@
+# scheduler_realtime.py
+import math, time
+from typing import Callable, Optional
+
+class Pacer:
+    """Reloj de ritmo para tiempo real: traduce tiempo de pared (monotónico) a tiempo simulado.
+
+    Las esperas se calculan siempre contra un ancla (instante de pared, tiempo simulado),
+    así que los retrasos de un tick no se acumulan en los siguientes. Cambiar la velocidad
+    o pausar mueve el ancla al punto actual.
+    """
+    MIN_SPEED, MAX_SPEED = 0.01, 100.0
+
+    def __init__(self, unit_seconds: float, speed: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.unit_seconds = unit_seconds
+        self.clock = clock
+        self.speed = self._check(speed)
+        self.paused = False
+        self._anchor_wall: Optional[float] = None
+        self._anchor_sim = 0.0
+
+    def _check(self, speed: float) -> float:
+        if not self.MIN_SPEED <= speed <= self.MAX_SPEED:
+            raise ValueError(f"Velocidad fuera de rango ({self.MIN_SPEED}x a {self.MAX_SPEED}x)")
+        return speed
+
+    @property
+    def started(self) -> bool:
+        return self._anchor_wall is not None
+
+    def start(self, sim_time: float = 0):
+        self._anchor_wall = self.clock()
+        self._anchor_sim = float(sim_time)
+        return self
+
+    def position(self) -> float:
+        """Tiempo simulado que debería haberse alcanzado ahora."""
+        if self.paused or self._anchor_wall is None:
+            return self._anchor_sim
+        return self._anchor_sim + (self.clock() - self._anchor_wall) * self.speed / self.unit_seconds
+
+    def _reanchor(self):
+        self._anchor_sim = self.position()
+        self._anchor_wall = self.clock()
+
+    def set_speed(self, speed: float):
+        speed = self._check(speed)
+        self._reanchor()
+        self.speed = speed
+
+    def pause(self):
+        if not self.paused:
+            self._reanchor()
+            self.paused = True
+
+    def resume(self):
+        if self.paused:
+            self._anchor_wall = self.clock()
+            self.paused = False
+
+    def due(self, sim_time: float) -> bool:
+        return not self.paused and self.position() >= sim_time
+
+    def delay_until(self, sim_time: float) -> float:
+        """Segundos de pared hasta que `sim_time` esté al día (inf si está en pausa)."""
+        if self.paused:
+            return math.inf
+        return max(0.0, (sim_time - self.position()) * self.unit_seconds / self.speed)
+
+async def run_realtime(sim, pacer: Pacer, max_time=None, on_step=None, poll: float = 0.25):
+    """Avanza `sim` al ritmo de `pacer` sin bloquear el bucle de eventos.
+
+    Varias simulaciones pueden correr a la vez con asyncio.gather en un solo hilo.
+    `poll` acota cada espera para reaccionar a pausas y cambios de velocidad.
+    """
+    import asyncio   # perezoso: el motor importa Pacer y los lotes sin GUI no usan asyncio
+    if not pacer.started:
+        pacer.start(sim.time)
+    while True:
+        while not pacer.due(sim.time):
+            await asyncio.sleep(min(pacer.delay_until(sim.time), poll))
+        if not sim.step(max_time):
+            break
+        if on_step:
+            on_step(sim)
+    return sim._compute_metrics()
+
+def run_scheduled(schedule, sim, pacer: Pacer, max_time=None, on_step=None, on_done=None, poll: float = 0.25):
+    """Variante por callbacks de `run_realtime` para bucles ajenos a asyncio.
+
+    `schedule(ms, fn)` programa la siguiente revisión (p. ej. `widget.after` en Tk),
+    de modo que la GUI avanza la simulación sin hilos auxiliares.
+    """
+    if not pacer.started:
+        pacer.start(sim.time)
+
+    def tick():
+        while pacer.due(sim.time):
+            if not sim.step(max_time):
+                if on_done:
+                    on_done(sim)
+                return
+            if on_step:
+                on_step(sim)
+        schedule(max(1, int(min(pacer.delay_until(sim.time), poll) * 1000)), tick)
+
+    tick()
@@ -1,19 +1,28 @@
 # scheduler_sim.py
 from dataclasses import dataclass, field
-from typing import List, Optional, Deque, Dict, Tuple
-from collections import deque
+from typing import Iterable, Iterator, List, Optional, Dict, Tuple, Union
+from operator import attrgetter
 import itertools, time
+from scheduler_queues import ReadyQueue
+from scheduler_policies import Policy, make_policy
+from scheduler_timeline import Timeline, ARRIVE, DISPATCH, PREEMPT, COMPLETE, BLOCK, WAKE, SWITCH
+from scheduler_io import IoDevices
+from scheduler_metrics import compute_metrics
+from scheduler_realtime import Pacer
 
 TIME_UNIT_SECONDS = 5
 _pid_counter = itertools.count(1)
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class Process:
     sort_index: int = field(init=False, repr=False)
     name: str
     burst_time: int
     arrival_time: int
     quantum: Optional[int] = None
+    priority: int = field(default=0, compare=False)
+    # Ráfagas alternas CPU, E/S, CPU, ...; burst_time es la suma de las de CPU
+    bursts: Optional[Tuple[int, ...]] = field(default=None, compare=False)
     pid: int = field(default_factory=lambda: next(_pid_counter), compare=False)
     remaining_time: int = field(init=False, compare=False)
     start_time: Optional[int] = field(default=None, compare=False)
@@ -21,55 +30,70 @@ class Process:
     response_time: Optional[int] = field(default=None, compare=False)
     waiting_time: Optional[int] = field(default=None, compare=False)
     turnaround_time: Optional[int] = field(default=None, compare=False)
+    io_time: int = field(default=0, init=False, compare=False)   # bloqueado: en cola de E/S o en dispositivo
     _rr_slice_left: Optional[int] = field(default=None, compare=False)
+    _burst_idx: int = field(default=0, init=False, repr=False, compare=False)
+    _blocked_at: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.remaining_time = self.burst_time
         self.sort_index = self.arrival_time
+        if self.bursts is not None:
+            self.bursts = tuple(self.bursts)
+            if len(self.bursts) % 2 == 0 or min(self.bursts) <= 0:
+                raise ValueError("Las ráfagas deben alternar CPU/E/S, empezar y acabar en CPU y ser > 0")
+            if sum(self.bursts[0::2]) != self.burst_time:
+                raise ValueError("burst_time debe ser la suma de las ráfagas de CPU")
+            self.remaining_time = self.bursts[0]
 
     def clone_for_sim(self):
+        # Conserva el PID: la simulación muestra los mismos PID que la cola de entrada
         return Process(
             name=self.name, burst_time=self.burst_time,
-            arrival_time=self.arrival_time, quantum=self.quantum
+            arrival_time=self.arrival_time, quantum=self.quantum, priority=self.priority,
+            bursts=self.bursts, pid=self.pid
         )
 
 class Scheduler:
-    def __init__(self, processes: List[Process], algorithm: str, rr_quantum: Optional[int] = None, real_time: bool = False):
-        algo = algorithm.upper()
-        if algo not in {"FCFS","SJF","SRTF","RR"}:
-            raise ValueError("Algoritmo inválido")
-        if algo=="RR" and rr_quantum is None:
-            raise ValueError("Round Robin requiere quantum")
-        self.processes = sorted([p.clone_for_sim() for p in processes], key=lambda x: x.arrival_time)
-        self.algorithm = algo
-        self.rr_quantum = rr_quantum
+    def __init__(self, processes: Iterable[Process], algorithm: Union[str, Policy], rr_quantum: Optional[int] = None,
+                 real_time: bool = False, event_driven: bool = False, io_devices: int = 1,
+                 switch_cost: int = 0, warmup_cost: int = 0):
+        if switch_cost < 0 or warmup_cost < 0:
+            raise ValueError("Los costes de cambio de contexto deben ser >= 0")
+        # La política se resuelve una sola vez; el bucle solo llama a sus ganchos
+        policy = make_policy(algorithm, rr_quantum) if isinstance(algorithm, str) else algorithm
+        # Un iterador se consume bajo demanda (traza ya ordenada por llegada); una lista se ordena
+        if isinstance(processes, Iterator):
+            self.processes: Optional[List[Process]] = None
+            self._arrivals = map(Process.clone_for_sim, processes)
+        else:
+            self.processes = sorted(map(Process.clone_for_sim, processes), key=attrgetter("arrival_time"))
+            self._arrivals = iter(self.processes)
+        self.policy = policy
+        policy.bind(self)
+        self.algorithm = policy.name
+        self.rr_quantum = policy.quantum
         self.real_time = real_time
+        self.event_driven = event_driven
         self.time = 0
-        self.ready: Deque[Process] = deque()
+        self.ready: ReadyQueue = policy.ready
         self.running: Optional[Process] = None
         self.finished: List[Process] = []
-        self.timeline: List[Tuple[int, Optional[int], List[int], List[int]]] = []
-
-    def _select_next_fcfs(self):
-        return self.ready.popleft() if self.ready else None
-    def _select_next_sjf(self):
-        if not self.ready: return None
-        best_idx = min(range(len(self.ready)), key=lambda i: self.ready[i].burst_time)
-        self.ready.rotate(-best_idx)
-        chosen = self.ready.popleft()
-        self.ready.rotate(best_idx)
-        return chosen
-    def _select_next_srtf(self):
-        candidates = list(self.ready)
-        if self.running: candidates.append(self.running)
-        if not candidates: return None
-        best = min(candidates, key=lambda p: p.remaining_time)
-        if self.running is best: return self.running
-        if best in self.ready: self.ready.remove(best)
-        if self.running: self.ready.append(self.running)
-        return best
-    def _select_next_rr(self):
-        return self.ready.popleft() if self.ready else None
+        self._pending: Optional[Process] = next(self._arrivals, None)
+        self.timeline = Timeline()
+        self.busy = 0
+        self.io = IoDevices(io_devices)
+        # Cambio de contexto: switch_cost en cada cambio de proceso en la CPU, más warmup_cost
+        # si el proceso ya había ejecutado (vuelve con la caché fría). El cambio y el primer
+        # tick posterior no son expropiables, así que cada cambio pagado hace avanzar al proceso.
+        self.switch_cost = switch_cost
+        self.warmup_cost = warmup_cost
+        self.switches = 0
+        self.overhead = 0
+        self._switch_left = 0
+        self._fresh = False
+        self._last_pid: Optional[int] = None
+        self.metrics: Optional[Dict[str, float]] = None
 
     def _start_if_needed(self,p):
         if p.start_time is None:
@@ -78,50 +102,156 @@ class Scheduler:
     def _complete(self,p):
         p.completion_time = self.time+1
         p.turnaround_time = p.completion_time - p.arrival_time
-        p.waiting_time = p.turnaround_time - p.burst_time
+        p.waiting_time = p.turnaround_time - p.burst_time - p.io_time
         self.finished.append(p)
         self.running = None
-    def _snapshot(self):
-        self.timeline.append((self.time, self.running.pid if self.running else None,
-                              [p.pid for p in self.ready],
-                              [p.pid for p in self.finished]))
+        self.policy.on_complete(p)
+        self.timeline.record(self.time+1, COMPLETE, p.pid)
+    def iter_timeline(self):
+        return self.timeline.rows()
+    def _admit(self):
+        # Las llegadas vienen ordenadas: basta mirar el siguiente pendiente
+        p=self._pending
+        while p is not None and p.arrival_time<=self.time:
+            self.policy.on_arrive(p)
+            self.timeline.record(self.time, ARRIVE, p.pid)
+            nxt=next(self._arrivals, None)
+            if nxt is not None and nxt.arrival_time<p.arrival_time:
+                raise ValueError("La traza debe estar ordenada por llegada")
+            p=nxt
+        self._pending=p
+    def _has_work(self):
+        return self._pending is not None or self.running is not None or len(self.ready)>0 or self.io.n>0
+    def _io_next(self,p):
+        # Si quedan ráfagas, manda a E/S la siguiente y prepara la de CPU posterior
+        bursts=p.bursts
+        i=p._burst_idx
+        if bursts is None or i+1>=len(bursts):
+            return False
+        self.io.block(p, bursts[i+1])
+        p._burst_idx=i+2
+        p.remaining_time=bursts[i+2]
+        p._blocked_at=self.time+1
+        return True
+    def _wake(self,done):
+        for p in done:
+            p.io_time+=self.time+1-p._blocked_at
+            self.policy.on_arrive(p)
+            self.timeline.record(self.time+1, WAKE, p.pid)
+    def _dispatch(self):
+        if self._switch_left or self._fresh: return
+        prev=self.running
+        self.running=self.policy.select(prev)
+        if self.running is not prev:
+            if prev: self.timeline.record(self.time, PREEMPT, prev.pid)
+            if self.running: self._switch_in(self.running)
+    def _switch_in(self,p):
+        cost=0
+        if p.pid!=self._last_pid:
+            self.switches+=1
+            self._last_pid=p.pid
+            cost=self.switch_cost+(self.warmup_cost if p.start_time is not None else 0)
+        if cost:
+            self._switch_left=cost
+            self.timeline.record(self.time, SWITCH, p.pid)
+        else:
+            self.timeline.record(self.time, DISPATCH, p.pid)
+    def _run_overhead(self,span):
+        # Tramo dedicado al cambio de contexto: la CPU está ocupada pero el proceso no avanza
+        self._switch_left-=span
+        self.overhead+=span
+        if not self._switch_left:
+            self._fresh=True
+            self.timeline.record(self.time+span, DISPATCH, self.running.pid)
+    def _end_tick(self):
+        if self.running:
+            if self.running.remaining_time==0:
+                r=self.running
+                if self._io_next(r):
+                    self.running=None
+                    self.policy.on_block(r)
+                    self.timeline.record(self.time+1, BLOCK, r.pid)
+                else:
+                    self._complete(r)
+            elif self.policy.slice_left(self.running)==0:
+                r=self.running; self.running=None
+                self.policy.on_preempt(r)
+                self.timeline.record(self.time+1, PREEMPT, r.pid)
+    def step(self,max_time=None):
+        # Un tick (o un tramo entre eventos en modo por eventos); False si ya no hay nada que hacer
+        if not self._has_work() or (max_time is not None and self.time>=max_time):
+            return False
+        self.metrics=None
+        if self.event_driven:
+            return self._step_events(max_time)
+        self._admit()
+        self._dispatch()
+        io=self.io
+        if io.n: io.start()
+        if self._switch_left:
+            self._run_overhead(1)
+        elif self.running:
+            self._fresh=False
+            self._start_if_needed(self.running)
+            self.running.remaining_time-=1
+            self.busy+=1
+            self.policy.on_tick(self.running,1)
+        woken=io.advance(1) if io.n else None
+        self.timeline.end=self.time+1
+        self._end_tick()
+        if woken: self._wake(woken)
+        self.time+=1
+        return True
+    def _step_events(self,max_time=None):
+        # Salta directamente a la siguiente llegada, fin de ráfaga, fin de quantum o fin de E/S
+        self._admit()
+        self._dispatch()
+        io=self.io
+        limits=[]
+        if io.n:
+            io.start()
+            left=io.next_event()
+            if left is not None: limits.append(left)
+        if self._pending is not None: limits.append(self._pending.arrival_time-self.time)
+        if max_time is not None: limits.append(max_time-self.time)
+        if self._switch_left:
+            limits.append(self._switch_left)
+        elif self.running:
+            if self._fresh: limits.append(1)
+            limits.append(self.running.remaining_time)
+            left=self.policy.slice_left(self.running)
+            if left is not None: limits.append(left)
+            left=self.policy.horizon(self.running)
+            if left is not None: limits.append(left)
+        if not limits: return False
+        span=min(limits)
+        if self._switch_left:
+            self._run_overhead(span)
+        elif self.running:
+            self._fresh=False
+            self._start_if_needed(self.running)
+            self.running.remaining_time-=span
+            self.busy+=span
+            self.policy.on_tick(self.running,span)
+        woken=io.advance(span) if io.n else None
+        self.timeline.end=self.time+span
+        self.time+=span-1
+        self._end_tick()
+        if woken: self._wake(woken)
+        self.time+=1
+        return True
     def simulate(self,max_time=None):
-        admitted=set()
-        while len(self.finished)<len(self.processes) and (max_time is None or self.time<max_time):
-            for p in self.processes:
-                if p.arrival_time==self.time and p.pid not in admitted:
-                    admitted.add(p.pid)
-                    self.ready.append(p)
-            if self.algorithm=="FCFS" and self.running is None:
-                self.running=self._select_next_fcfs()
-            elif self.algorithm=="SJF" and self.running is None:
-                self.running=self._select_next_sjf()
-            elif self.algorithm=="SRTF":
-                self.running=self._select_next_srtf()
-            elif self.algorithm=="RR" and self.running is None:
-                self.running=self._select_next_rr()
-                if self.running and self.running._rr_slice_left is None:
-                    q=self.running.quantum or self.rr_quantum
-                    self.running._rr_slice_left=q
-            if self.running:
-                self._start_if_needed(self.running)
-                self.running.remaining_time-=1
-                if self.algorithm=="RR":
-                    self.running._rr_slice_left-=1
-            self._snapshot()
-            if self.real_time: time.sleep(TIME_UNIT_SECONDS)
-            if self.running:
-                if self.running.remaining_time==0:
-                    self._complete(self.running)
-                elif self.algorithm=="RR" and self.running._rr_slice_left==0:
-                    r=self.running; self.running=None
-                    r._rr_slice_left=r.quantum or self.rr_quantum
-                    self.ready.append(r)
-            self.time+=1
+        pacer=Pacer(TIME_UNIT_SECONDS).start(self.time) if self.real_time else None
+        while self.step(max_time):
+            if pacer: time.sleep(pacer.delay_until(self.time))
         return self._compute_metrics()
     def _compute_metrics(self):
-        n=len(self.processes)
-        avg_wait=sum(p.waiting_time for p in self.finished)/n
-        avg_turn=sum(p.turnaround_time for p in self.finished)/n
-        avg_resp=sum(p.response_time for p in self.finished)/n
-        return {"avg_waiting":avg_wait,"avg_turnaround":avg_turn,"avg_response":avg_resp}
+        if self.metrics is None:
+            self.metrics=compute_metrics(self.finished,self.time,self.busy,io_busy=self.io.busy,
+                                         switches=self.switches,overhead=self.overhead)
+        return self.metrics
+
+if __name__ == "__main__":
+    import sys
+    from scheduler_cli import main
+    sys.exit(main())
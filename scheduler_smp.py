@@ -0,0 +1,220 @@
+# scheduler_smp.py
+"""Simulación multiprocesador (SMP): N CPU con colas por CPU o una cola global.
+
+Con colas por CPU cada llegada va a la CPU menos cargada y se puede balancear:
+"steal" deja que una CPU ociosa robe de la cola más larga al despachar; "push"
+reparte cada `balance_interval` ticks las colas hasta que difieran en uno como mucho.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Union
+from scheduler_sim import Process, Scheduler
+from scheduler_policies import Policy, make_policy
+from scheduler_timeline import SmpTimeline, ARRIVE, DISPATCH, PREEMPT, COMPLETE, BLOCK, WAKE, SWITCH
+from scheduler_metrics import compute_metrics
+
+QUEUE_MODES = ("per-cpu", "global")
+BALANCE_MODES = (None, "steal", "push")
+
+class SmpScheduler(Scheduler):
+    def __init__(self, processes: Iterable[Process], algorithm: Union[str, Callable[[], Policy]], cpus: int = 2,
+                 rr_quantum: Optional[int] = None, queues: str = "per-cpu", balance: Optional[str] = None,
+                 balance_interval: int = 10, real_time: bool = False, event_driven: bool = False,
+                 io_devices: int = 1, switch_cost: int = 0, warmup_cost: int = 0, **policy_options):
+        if cpus < 1:
+            raise ValueError("Se necesita al menos una CPU")
+        if queues not in QUEUE_MODES:
+            raise ValueError(f"Modo de colas inválido: {queues!r}")
+        if balance not in BALANCE_MODES:
+            raise ValueError(f"Modo de balanceo inválido: {balance!r}")
+        if balance and queues == "global":
+            raise ValueError("El balanceo requiere colas por CPU")
+        if balance == "push" and balance_interval <= 0:
+            raise ValueError("El intervalo de balanceo debe ser > 0")
+        # `algorithm` es un nombre registrado o una fábrica: cada cola necesita su propia política
+        if isinstance(algorithm, str):
+            make = lambda: make_policy(algorithm, rr_quantum, **policy_options)
+        else:
+            make = algorithm
+        self.policies: List[Policy] = [make() for _ in range(cpus if queues == "per-cpu" else 1)]
+        super().__init__(processes, self.policies[0], real_time=real_time, event_driven=event_driven,
+                         io_devices=io_devices, switch_cost=switch_cost, warmup_cost=warmup_cost)
+        for pol in self.policies[1:]:
+            pol.bind(self)
+        self.cpus = cpus
+        self.queues = queues
+        self.balance = balance
+        self.balance_interval = balance_interval
+        self._next_balance = balance_interval
+        self.core_policy = [self.policies[c] if queues == "per-cpu" else self.policies[0] for c in range(cpus)]
+        self.cores: List[Optional[Process]] = [None] * cpus
+        self._home: Dict[int, Policy] = {}   # pid -> política que lo tenía al bloquearse en E/S
+        self.core_busy = [0] * cpus
+        # El cambio de contexto se cuenta por CPU: cada una recuerda su último proceso
+        self._switch_left = [0] * cpus
+        self._fresh = [False] * cpus
+        self._last_pid: List[Optional[int]] = [None] * cpus
+        self.timeline = SmpTimeline(cpus)
+
+    def _has_work(self):
+        return (self._pending is not None or self.io.n > 0 or any(p is not None for p in self.cores)
+                or any(len(pol.ready) for pol in self.policies))
+
+    def _target(self, p) -> int:
+        # Cola con menos trabajo (en cola + en CPU); a igualdad, la de menor índice
+        if len(self.policies) == 1:
+            return 0
+        return min(range(self.cpus), key=lambda c: len(self.policies[c].ready) + (self.cores[c] is not None))
+
+    def _admit(self):
+        p=self._pending
+        while p is not None and p.arrival_time<=self.time:
+            c=self._target(p)
+            self.policies[c].on_arrive(p)
+            self.timeline.record(self.time, ARRIVE, p.pid, c)
+            nxt=next(self._arrivals, None)
+            if nxt is not None and nxt.arrival_time<p.arrival_time:
+                raise ValueError("La traza debe estar ordenada por llegada")
+            p=nxt
+        self._pending=p
+
+    def _wake(self, done):
+        for p in done:
+            p.io_time+=self.time+1-p._blocked_at
+            c=self._target(p)
+            self._home.pop(p.pid).migrate(p, self.policies[c])
+            self.timeline.record(self.time+1, WAKE, p.pid, c)
+
+    def _steal(self, c: int):
+        victim = max(self.policies, key=lambda pol: len(pol.ready))
+        if victim is not self.policies[c] and len(victim.ready):
+            victim.migrate(victim.ready.pop(), self.policies[c])
+
+    def _rebalance(self):
+        pols = self.policies
+        while True:
+            src = max(pols, key=lambda pol: len(pol.ready))
+            dst = min(pols, key=lambda pol: len(pol.ready))
+            if len(src.ready) - len(dst.ready) <= 1:
+                break
+            src.migrate(src.ready.pop(), dst)
+
+    def _dispatch(self):
+        cores, steal = self.cores, self.balance == "steal"
+        # Primero las CPU ociosas y luego las ocupadas: con cola global, una CPU ocupada no
+        # debe expropiar a su proceso por uno que una CPU libre puede tomar
+        order = [c for c in range(self.cpus) if cores[c] is None] + \
+                [c for c in range(self.cpus) if cores[c] is not None]
+        for c in order:
+            if self._switch_left[c] or self._fresh[c]: continue
+            pol, prev = self.core_policy[c], cores[c]
+            if prev is None and steal and not pol.ready:
+                self._steal(c)
+            cur = cores[c] = pol.select(prev)
+            if cur is not prev:
+                if prev: self.timeline.record(self.time, PREEMPT, prev.pid, c)
+                if cur: self._switch_in(c, cur)
+
+    def _switch_in(self, c: int, p):
+        cost = 0
+        if p.pid != self._last_pid[c]:
+            self.switches += 1
+            self._last_pid[c] = p.pid
+            cost = self.switch_cost + (self.warmup_cost if p.start_time is not None else 0)
+        if cost:
+            self._switch_left[c] = cost
+            self.timeline.record(self.time, SWITCH, p.pid, c)
+        else:
+            self.timeline.record(self.time, DISPATCH, p.pid, c)
+
+    def _complete_on(self, c: int, p):
+        p.completion_time = self.time+1
+        p.turnaround_time = p.completion_time - p.arrival_time
+        p.waiting_time = p.turnaround_time - p.burst_time - p.io_time
+        self.finished.append(p)
+        self.cores[c] = None
+        self.core_policy[c].on_complete(p)
+        self.timeline.record(self.time+1, COMPLETE, p.pid, c)
+
+    def _end_tick(self):
+        for c, p in enumerate(self.cores):
+            if p is None: continue
+            pol = self.core_policy[c]
+            if p.remaining_time==0:
+                if self._io_next(p):
+                    self.cores[c] = None
+                    pol.on_block(p)
+                    self._home[p.pid] = pol
+                    self.timeline.record(self.time+1, BLOCK, p.pid, c)
+                else:
+                    self._complete_on(c, p)
+            elif pol.slice_left(p)==0:
+                self.cores[c] = None
+                pol.on_preempt(p)
+                self.timeline.record(self.time+1, PREEMPT, p.pid, c)
+
+    def _span(self, max_time) -> int:
+        # Modo por eventos: hasta la próxima llegada, fin de ráfaga o de quantum, E/S, horizonte o balanceo
+        limits=[]
+        left=self.io.next_event() if self.io.n else None
+        if left is not None: limits.append(left)
+        if self._pending is not None: limits.append(self._pending.arrival_time-self.time)
+        if max_time is not None: limits.append(max_time-self.time)
+        if self.balance=="push" and any(len(pol.ready) for pol in self.policies):
+            limits.append(self._next_balance-self.time)
+        for c, p in enumerate(self.cores):
+            if p is None: continue
+            if self._switch_left[c]:
+                limits.append(self._switch_left[c])
+                continue
+            if self._fresh[c]: limits.append(1)
+            pol = self.core_policy[c]
+            limits.append(p.remaining_time)
+            left=pol.slice_left(p)
+            if left is not None: limits.append(left)
+            left=pol.horizon(p)
+            if left is not None: limits.append(left)
+        return min(limits) if limits else 0
+
+    def step(self,max_time=None):
+        if not self._has_work() or (max_time is not None and self.time>=max_time):
+            return False
+        self.metrics=None
+        self._admit()
+        if self.balance=="push" and self.time>=self._next_balance:
+            # Por eventos se pueden saltar puntos de balanceo (con las colas vacías): solo se
+            # balancea en el punto exacto, como en modo tick, y se pasa al siguiente
+            if self.time==self._next_balance: self._rebalance()
+            self._next_balance=(self.time//self.balance_interval+1)*self.balance_interval
+        self._dispatch()
+        io=self.io
+        if io.n: io.start()
+        span=self._span(max_time) if self.event_driven else 1
+        if not span: return False
+        for c, p in enumerate(self.cores):
+            if p is None: continue
+            if self._switch_left[c]:
+                # Tramo de cambio de contexto: la CPU no hace avanzar al proceso
+                self._switch_left[c] -= span
+                self.overhead += span
+                if not self._switch_left[c]:
+                    self._fresh[c] = True
+                    self.timeline.record(self.time+span, DISPATCH, p.pid, c)
+                continue
+            self._fresh[c] = False
+            self._start_if_needed(p)
+            p.remaining_time-=span
+            self.core_busy[c]+=span
+            self.busy+=span
+            self.core_policy[c].on_tick(p,span)
+        woken=io.advance(span) if io.n else None
+        self.timeline.end=self.time+span
+        self.time+=span-1
+        self._end_tick()
+        if woken: self._wake(woken)
+        self.time+=1
+        return True
+
+    def _compute_metrics(self):
+        if self.metrics is None:
+            self.metrics=compute_metrics(self.finished,self.time,self.busy,per_cpu=self.core_busy,
+                                         io_busy=self.io.busy,switches=self.switches,overhead=self.overhead)
+        return self.metrics
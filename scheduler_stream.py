@@ -0,0 +1,197 @@
+# scheduler_stream.py
+"""Simulación de sistema abierto: llegadas sin fin y memoria acotada.
+
+OpenSystem desengancha el historial de un Scheduler (o SmpScheduler) alimentado con
+un iterador de llegadas: los procesos terminados no se guardan, solo actualizan
+estadísticas en línea, y la línea de tiempo no se registra. Cada `interval` ticks
+se emite un informe con las medias de la ventana y cuantiles acumulados (P²).
+
+    python scheduler_stream.py -a RR -q 4 --rate 0.15 --interval 10000 --max-time 1000000
+"""
+import argparse, json, sys
+from typing import Dict, Iterator, List, Optional
+from scheduler_metrics import METRICS, PERCENTILES, percentile
+
+class P2Quantile:
+    """Estimador P² (Jain y Chlamtac, 1985) de un cuantil con cinco marcadores."""
+    def __init__(self, q: float):
+        if not 0 < q < 1:
+            raise ValueError("El cuantil debe estar en (0, 1)")
+        self.q = q
+        self.n = 0
+        self._first: List[float] = []
+        self._h: Optional[List[float]] = None
+
+    def add(self, x: float):
+        self.n += 1
+        h = self._h
+        if h is None:
+            self._first.append(x)
+            if len(self._first) == 5:
+                q = self.q
+                self._h = sorted(self._first)
+                self._pos = [1, 2, 3, 4, 5]
+                self._want = [1, 1 + 2*q, 1 + 4*q, 3 + 2*q, 5]
+                self._dn = (0, q/2, q, (1 + q)/2, 1)
+            return
+        pos, want = self._pos, self._want
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= h[k+1]: k += 1
+        for i in range(k+1, 5): pos[i] += 1
+        for i in range(5): want[i] += self._dn[i]
+        for i in (1, 2, 3):
+            d = want[i] - pos[i]
+            if (d >= 1 and pos[i+1] - pos[i] > 1) or (d <= -1 and pos[i-1] - pos[i] < -1):
+                d = 1 if d > 0 else -1
+                # Interpolación parabólica; si se sale del orden, lineal
+                hp = h[i] + d / (pos[i+1] - pos[i-1]) * (
+                    (pos[i] - pos[i-1] + d) * (h[i+1] - h[i]) / (pos[i+1] - pos[i])
+                    + (pos[i+1] - pos[i] - d) * (h[i] - h[i-1]) / (pos[i] - pos[i-1]))
+                if not h[i-1] < hp < h[i+1]:
+                    hp = h[i] + d * (h[i+d] - h[i]) / (pos[i+d] - pos[i])
+                h[i] = hp
+                pos[i] += d
+
+    def value(self) -> float:
+        if self._h is None:
+            return percentile(sorted(self._first), self.q * 100)
+        return self._h[2]
+
+class OnlineMetrics:
+    """Sumidero de procesos terminados: medias por ventana y cuantiles acumulados.
+
+    Hace de `sim.finished` (el motor solo llama a append) y no retiene los procesos.
+    """
+    def __init__(self):
+        self.total = 0
+        self.quantiles = {m: [P2Quantile(q / 100) for q in PERCENTILES] for m in METRICS}
+        self._reset()
+
+    def _reset(self):
+        self.count = 0
+        self._sums = dict.fromkeys(METRICS, 0)
+
+    def append(self, p):
+        vals = {"waiting": p.waiting_time, "turnaround": p.turnaround_time, "response": p.response_time}
+        for m, v in vals.items():
+            self._sums[m] += v
+            for est in self.quantiles[m]:
+                est.add(v)
+        self.count += 1
+        self.total += 1
+
+    def __len__(self):
+        return self.total
+
+    def window(self) -> Dict[str, float]:
+        """Medias de la ventana actual y cuantiles acumulados; abre una ventana nueva."""
+        out: Dict[str, float] = {}
+        for m in METRICS:
+            out[f"avg_{m}"] = self._sums[m] / self.count if self.count else 0.0
+            for q, est in zip(PERCENTILES, self.quantiles[m]):
+                out[f"p{q}_{m}"] = est.value()
+        out["completed"] = self.count
+        self._reset()
+        return out
+
+class NullTimeline:
+    """Línea de tiempo que no registra nada (el motor solo llama a record y asigna end)."""
+    def __init__(self):
+        self.end = 0
+        self.times = ()
+
+    def record(self, *event):
+        pass
+
+    def __len__(self):
+        return self.end
+
+    def events(self):
+        return iter(())
+
+class OpenSystem:
+    """Ejecuta `sim` (con llegadas como iterador) emitiendo un informe cada `interval` ticks."""
+    def __init__(self, sim, interval: int = 1000):
+        if interval <= 0:
+            raise ValueError("El intervalo de informe debe ser > 0")
+        if sim.processes is not None:
+            raise ValueError("El sistema abierto necesita las llegadas como iterador")
+        self.sim = sim
+        self.interval = interval
+        self.stats = sim.finished = OnlineMetrics()
+        sim.timeline = NullTimeline()
+        self._cpus = getattr(sim, "cpus", 1)
+
+    def in_system(self) -> int:
+        sim = self.sim
+        if hasattr(sim, "cores"):
+            running = sum(p is not None for p in sim.cores)
+            ready = sum(len(pol.ready) for pol in sim.policies)
+        else:
+            running, ready = sim.running is not None, len(sim.ready)
+        return running + ready + sim.io.n
+
+    def reports(self, max_time: Optional[int] = None) -> Iterator[Dict[str, float]]:
+        sim = self.sim
+        t0, busy0 = sim.time, sim.busy
+        while True:
+            end = (sim.time // self.interval + 1) * self.interval
+            if max_time is not None: end = min(end, max_time)
+            while sim.step(end):
+                pass
+            dt = sim.time - t0
+            if dt <= 0:
+                return
+            rep = {"time": sim.time, **self.stats.window()}
+            rep["throughput"] = rep["completed"] / dt
+            rep["cpu_utilization"] = (sim.busy - busy0) / (dt * self._cpus)
+            rep["in_system"] = self.in_system()
+            rep["total_completed"] = self.stats.total
+            yield rep
+            t0, busy0 = sim.time, sim.busy
+            if sim.time < end or (max_time is not None and sim.time >= max_time):
+                return
+
+def main(argv=None) -> int:
+    from scheduler_sim import Scheduler
+    from scheduler_smp import SmpScheduler
+    from scheduler_policies import make_policy
+    from scheduler_trace import read_trace
+    from scheduler_workload import generate
+    ap = argparse.ArgumentParser(description="Sistema abierto con métricas en línea (JSONL por intervalo)")
+    ap.add_argument("workload", nargs="?", help="traza ordenada por llegada; sin ella se genera una carga sin fin")
+    ap.add_argument("-a", "--algorithm", default="RR")
+    ap.add_argument("-q", "--quantum", type=int, default=4)
+    ap.add_argument("--cpus", type=int, default=1)
+    ap.add_argument("--interval", type=int, default=1000, help="ticks entre informes")
+    ap.add_argument("--max-time", type=int, default=None)
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--rate", type=float, default=0.15)
+    ap.add_argument("--mean-burst", type=float, default=5.0)
+    ap.add_argument("--bursts", default="exponential")
+    args = ap.parse_args(argv)
+    try:
+        arrivals = (read_trace(args.workload) if args.workload else
+                    generate(None, args.seed, rate=args.rate, mean_burst=args.mean_burst, bursts=args.bursts))
+        if args.cpus > 1:
+            sim = SmpScheduler(arrivals, args.algorithm, cpus=args.cpus, rr_quantum=args.quantum, event_driven=True)
+        else:
+            sim = Scheduler(arrivals, make_policy(args.algorithm, args.quantum), event_driven=True)
+        for rep in OpenSystem(sim, args.interval).reports(args.max_time):
+            print(json.dumps(rep), flush=True)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
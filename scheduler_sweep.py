@@ -0,0 +1,95 @@
+# scheduler_sweep.py
+import argparse, os, sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from scheduler_sim import Process, Scheduler
+from scheduler_policies import POLICIES
+from scheduler_trace import read_trace
+from scheduler_cli import write_table
+from scheduler_cache import ResultCache, run_key
+
+ALGORITHMS = ("FCFS", "SJF", "SRTF", "RR")
+
+# Carga de trabajo del proceso worker: se recibe una sola vez en el initializer
+_workload: List[Process] = []
+
+def _init_worker(workload: List[Process]):
+    global _workload
+    _workload = workload
+
+def _run(config: Tuple[str, Optional[int]]) -> Dict:
+    algo, q = config
+    sim = Scheduler(_workload, algo, rr_quantum=q, event_driven=True)
+    return {"algorithm": algo, "quantum": q, **sim.simulate()}
+
+def configs(algorithms: Iterable[str], quanta: Iterable[int]) -> List[Tuple[str, Optional[int]]]:
+    out = []
+    for algo in algorithms:
+        algo = algo.upper()
+        cls = POLICIES.get(algo)
+        if cls is None:
+            raise ValueError(f"Algoritmo inválido: {algo}")
+        if cls.needs_quantum:
+            out.extend((algo, q) for q in quanta)
+        else:
+            out.append((algo, None))
+    return out
+
+def sweep(processes: Sequence[Process], algorithms: Iterable[str] = ALGORITHMS,
+          quanta: Iterable[int] = (2,), workers: Optional[int] = None,
+          cache: Optional[ResultCache] = None) -> List[Dict]:
+    """Ejecuta cada combinación algoritmo/quantum y devuelve una fila de métricas por corrida.
+
+    Con `cache` solo se simulan las combinaciones que no estén ya guardadas.
+    """
+    grid = configs(algorithms, quanta)
+    workload = list(processes)
+    rows: Dict[Tuple[str, Optional[int]], Dict] = {}
+    keys = {}
+    if cache is not None:
+        for c in grid:
+            keys[c] = run_key(workload, *c)
+            m = cache.metrics(keys[c])
+            if m is not None:
+                rows[c] = {"algorithm": c[0], "quantum": c[1], **m}
+    todo = [c for c in grid if c not in rows]
+    workers = min(workers or os.cpu_count() or 1, len(todo))
+    if workers <= 1:
+        _init_worker(workload)
+        done = [_run(c) for c in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(workload,)) as ex:
+            done = list(ex.map(_run, todo, chunksize=max(1, len(todo) // (workers * 4))))
+    for c, row in zip(todo, done):
+        rows[c] = row
+        if cache is not None:
+            cache.put_metrics(keys[c], {k: v for k, v in row.items() if k not in ("algorithm", "quantum")})
+    return [rows[c] for c in grid]
+
+def _parse_quanta(text: str) -> List[int]:
+    out = []
+    for part in text.split(","):
+        if ":" in part:
+            lo, hi = part.split(":")
+            out.extend(range(int(lo), int(hi) + 1))
+        else:
+            out.append(int(part))
+    return out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Barrido de algoritmos y quantums sobre una carga de trabajo")
+    ap.add_argument("workload", help="traza CSV/JSONL con name,burst,arrival[,quantum]")
+    ap.add_argument("-a", "--algorithms", default=",".join(ALGORITHMS))
+    ap.add_argument("-q", "--quanta", default="2", help="lista o rangos, p. ej. 1,2,4 o 1:20")
+    ap.add_argument("-j", "--workers", type=int, default=None)
+    ap.add_argument("-f", "--format", choices=("csv", "json"), default="csv")
+    ap.add_argument("--cache-dir", default=None, help="directorio de caché de resultados entre barridos")
+    args = ap.parse_args(argv)
+    cache = ResultCache(path=args.cache_dir) if args.cache_dir else None
+    rows = sweep(list(read_trace(args.workload)), args.algorithms.split(","),
+                 _parse_quanta(args.quanta), args.workers, cache)
+    write_table(rows, args.format)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+# scheduler_timeline.py
+from array import array
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+
+ARRIVE, DISPATCH, PREEMPT, COMPLETE, BLOCK, WAKE, SWITCH = range(7)
+KIND_NAMES = ("arrive", "dispatch", "preempt", "complete", "block", "wake", "switch")
+# Valor de `run` mientras la CPU hace un cambio de contexto (los PID empiezan en 1).
+# SWITCH marca el inicio del cambio y el DISPATCH posterior, cuándo empieza a ejecutar.
+OVERHEAD = 0
+
+class Timeline:
+    """Registro compacto de cambios de estado en columnas (tiempo, tipo, pid).
+
+    Cada evento lleva el tick a partir del cual es visible; rows() reconstruye
+    bajo demanda las filas (t, run, ready, done) de una en una.
+    """
+    def __init__(self):
+        self.times = array("q")
+        self.kinds = array("B")
+        self.pids = array("q")
+        self.end = 0
+
+    def record(self, t: int, kind: int, pid: int):
+        self.times.append(t)
+        self.kinds.append(kind)
+        self.pids.append(pid)
+
+    def __len__(self):
+        return self.end
+
+    def events(self) -> Iterator[Tuple[int, str, int]]:
+        for t, k, pid in zip(self.times, self.kinds, self.pids):
+            yield (t, KIND_NAMES[k], pid)
+
+    def cursor(self) -> "TimelineCursor":
+        return TimelineCursor(self)
+
+    def head(self, n: int, end: int) -> "Timeline":
+        """Copia con los `n` primeros eventos y `end` ticks (para reanudar desde un checkpoint)."""
+        tl = Timeline()
+        tl.times, tl.kinds, tl.pids = self.times[:n], self.kinds[:n], self.pids[:n]
+        tl.end = end
+        return tl
+
+    def rows(self) -> Iterator[Tuple[int, Optional[int], List[int], List[int]]]:
+        return self.cursor().rows()
+
+    def runs(self) -> Iterator[Tuple[int, Optional[int]]]:
+        return self.cursor().runs()
+
+class TimelineCursor:
+    """Reproducción reanudable del registro: cada llamada entrega solo los ticks nuevos.
+
+    Sirve para pintar en vivo sin volver a recorrer el registro desde el tick 0.
+    """
+    def __init__(self, timeline: Timeline):
+        self.timeline = timeline
+        self.t = 0
+        self.run: Optional[int] = None
+        self._i = 0
+        self._ready = {}
+        self._done = []
+
+    def _advance(self, with_lists: bool, limit: Optional[int] = None):
+        tl = self.timeline
+        times, kinds, pids = tl.times, tl.kinds, tl.pids
+        ready, done = self._ready, self._done
+        run, i = self.run, self._i
+        while self.t < tl.end:
+            t = self.t
+            while i < len(times) and times[i] <= t:
+                k, pid = kinds[i], pids[i]
+                if k == ARRIVE or k == PREEMPT or k == WAKE:
+                    if k == PREEMPT and run == pid: run = None
+                    ready[pid] = None
+                elif k == DISPATCH or k == SWITCH:
+                    ready.pop(pid, None)
+                    run = pid if k == DISPATCH else OVERHEAD
+                else:
+                    # COMPLETE o BLOCK: deja la CPU; solo COMPLETE lo da por terminado
+                    if run == pid: run = None
+                    if k == COMPLETE: done.append(pid)
+                i += 1
+            self.t, self.run, self._i = t + 1, run, i
+            if not with_lists:
+                yield (t, run)
+            elif limit is None:
+                yield (t, run, list(ready), list(done))
+            else:
+                yield (t, run, list(islice(ready, limit)), done[-limit:])
+
+    @property
+    def n_ready(self) -> int:
+        return len(self._ready)
+
+    @property
+    def n_done(self) -> int:
+        return len(self._done)
+
+    def rows(self, limit: Optional[int] = None) -> Iterator[Tuple[int, Optional[int], List[int], List[int]]]:
+        """Filas nuevas; con `limit` se recortan READY (primeros) y DONE (últimos) a ese tamaño."""
+        return self._advance(True, limit)
+
+    def runs(self) -> Iterator[Tuple[int, Optional[int]]]:
+        return self._advance(False)
+
+    def spans(self) -> Iterator[Tuple[int, int, Optional[int]]]:
+        """Tramos (inicio, fin, pid) de los ticks nuevos, fusionando ticks seguidos del mismo pid."""
+        start = pid = None
+        for t, run in self.runs():
+            if start is None:
+                start, pid = t, run
+            elif run != pid:
+                yield (start, t, pid)
+                start, pid = t, run
+        if start is not None:
+            yield (start, self.t, pid)
+
+class SmpTimeline(Timeline):
+    """Registro para varias CPU: cada evento lleva además la CPU (en ARRIVE/WAKE, la cola de destino).
+
+    rows() entrega en `run` una tupla con el PID de cada CPU; lane(c) es la vista de
+    una sola CPU, con la interfaz que usa el Gantt (cursor, runs, end).
+    """
+    def __init__(self, ncpu: int):
+        super().__init__()
+        self.ncpu = ncpu
+        self.cpus = array("H")
+        self._lanes = [CpuLane(self, c) for c in range(ncpu)]
+
+    def record(self, t: int, kind: int, pid: int, cpu: int = 0):
+        self.times.append(t)
+        self.kinds.append(kind)
+        self.pids.append(pid)
+        self.cpus.append(cpu)
+
+    def events(self) -> Iterator[Tuple[int, str, int, int]]:
+        for t, k, pid, c in zip(self.times, self.kinds, self.pids, self.cpus):
+            yield (t, KIND_NAMES[k], pid, c)
+
+    def cursor(self) -> "SmpTimelineCursor":
+        return SmpTimelineCursor(self)
+
+    def head(self, n: int, end: int) -> "SmpTimeline":
+        tl = SmpTimeline(self.ncpu)
+        tl.times, tl.kinds, tl.pids, tl.cpus = self.times[:n], self.kinds[:n], self.pids[:n], self.cpus[:n]
+        tl.end = end
+        return tl
+
+    def lane(self, cpu: int) -> "CpuLane":
+        return self._lanes[cpu]
+
+    def lanes(self) -> List["CpuLane"]:
+        return list(self._lanes)
+
+class SmpTimelineCursor(TimelineCursor):
+    def __init__(self, timeline: SmpTimeline):
+        super().__init__(timeline)
+        self._runs: List[Optional[int]] = [None] * timeline.ncpu
+        self.run = tuple(self._runs)
+
+    def _advance(self, with_lists: bool, limit: Optional[int] = None):
+        tl = self.timeline
+        times, kinds, pids, cpus = tl.times, tl.kinds, tl.pids, tl.cpus
+        ready, done, runs = self._ready, self._done, self._runs
+        i = self._i
+        while self.t < tl.end:
+            t = self.t
+            while i < len(times) and times[i] <= t:
+                k, pid, c = kinds[i], pids[i], cpus[i]
+                if k == ARRIVE or k == WAKE:
+                    ready[pid] = None
+                elif k == PREEMPT:
+                    if runs[c] == pid: runs[c] = None
+                    ready[pid] = None
+                elif k == DISPATCH or k == SWITCH:
+                    ready.pop(pid, None)
+                    runs[c] = pid if k == DISPATCH else OVERHEAD
+                else:
+                    if runs[c] == pid: runs[c] = None
+                    if k == COMPLETE: done.append(pid)
+                i += 1
+            run = tuple(runs)
+            self.t, self.run, self._i = t + 1, run, i
+            if not with_lists:
+                yield (t, run)
+            elif limit is None:
+                yield (t, run, list(ready), list(done))
+            else:
+                yield (t, run, list(islice(ready, limit)), done[-limit:])
+
+class CpuLane:
+    """Carril de una CPU dentro de un SmpTimeline."""
+    def __init__(self, source: SmpTimeline, cpu: int):
+        self.source = source
+        self.cpu = cpu
+
+    @property
+    def end(self) -> int:
+        return self.source.end
+
+    def __len__(self):
+        return self.source.end
+
+    def cursor(self) -> "LaneCursor":
+        return LaneCursor(self)
+
+    def runs(self) -> Iterator[Tuple[int, Optional[int]]]:
+        return self.cursor().runs()
+
+class LaneCursor(TimelineCursor):
+    """Cursor de un solo carril: solo sigue los despachos, expropiaciones y fines de su CPU."""
+    def _advance(self, with_lists: bool, limit: Optional[int] = None):
+        lane = self.timeline
+        src, cpu = lane.source, lane.cpu
+        times, kinds, pids, cpus = src.times, src.kinds, src.pids, src.cpus
+        run, i = self.run, self._i
+        while self.t < src.end:
+            t = self.t
+            while i < len(times) and times[i] <= t:
+                if cpus[i] == cpu:
+                    k, pid = kinds[i], pids[i]
+                    if k == DISPATCH: run = pid
+                    elif k == SWITCH: run = OVERHEAD
+                    elif k != ARRIVE and k != WAKE and run == pid: run = None
+                i += 1
+            self.t, self.run, self._i = t + 1, run, i
+            yield (t, run, [], []) if with_lists else (t, run)
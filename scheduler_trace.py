@@ -0,0 +1,72 @@
+# scheduler_trace.py
+import csv, json, os
+from typing import Dict, Iterable, Iterator, Optional
+from scheduler_sim import Process
+
+FORMATS = ("csv", "jsonl")
+
+def _format_of(path: str, fmt: Optional[str]) -> str:
+    fmt = (fmt or os.path.splitext(path)[1].lstrip(".")).lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato de traza no soportado: {fmt!r}")
+    return fmt
+
+def process_from_record(rec: Dict) -> Process:
+    q = rec.get("quantum")
+    prio = rec.get("priority")
+    bursts = rec.get("bursts")
+    if bursts not in (None, ""):
+        # "3 2 4" en CSV o [3, 2, 4] en JSONL: CPU, E/S, CPU...; burst es opcional
+        bursts = tuple(int(b) for b in (bursts.replace(",", " ").split() if isinstance(bursts, str) else bursts))
+        burst = sum(bursts[0::2])
+    else:
+        bursts, burst = None, int(rec["burst"])
+    return Process(name=str(rec["name"]), burst_time=burst,
+                   arrival_time=int(rec["arrival"]),
+                   quantum=int(q) if q not in (None, "") else None,
+                   priority=int(prio) if prio not in (None, "") else 0,
+                   bursts=bursts)
+
+def iter_csv(f) -> Iterator[Process]:
+    for rec in csv.DictReader(f):
+        yield process_from_record(rec)
+
+def iter_jsonl(f) -> Iterator[Process]:
+    for line in f:
+        if line.strip():
+            yield process_from_record(json.loads(line))
+
+def read_trace(path: str, fmt: Optional[str] = None) -> Iterator[Process]:
+    """Genera los procesos de una traza CSV/JSONL (name, burst, arrival[, quantum, priority, bursts]) sin cargarla entera.
+
+    Si la traza está ordenada por llegada se puede pasar directamente a Scheduler,
+    que la va consumiendo a medida que avanza el tiempo simulado.
+    """
+    reader = iter_csv if _format_of(path, fmt) == "csv" else iter_jsonl
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from reader(f)
+
+TRACE_FIELDS = ("name", "burst", "arrival", "quantum", "priority", "bursts")
+
+def process_to_record(p: Process) -> Dict:
+    return {"name": p.name, "burst": p.burst_time, "arrival": p.arrival_time, "quantum": p.quantum,
+            "priority": p.priority, "bursts": list(p.bursts) if p.bursts is not None else None}
+
+def write_trace(processes: Iterable[Process], path: str, fmt: Optional[str] = None) -> int:
+    """Escribe los procesos en una traza CSV/JSONL sin acumularlos en memoria; devuelve cuántos escribió."""
+    fmt = _format_of(path, fmt)
+    n = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            w = csv.writer(f)
+            w.writerow(TRACE_FIELDS)
+            for p in processes:
+                w.writerow((p.name, p.burst_time, p.arrival_time, "" if p.quantum is None else p.quantum,
+                            p.priority, " ".join(map(str, p.bursts)) if p.bursts is not None else ""))
+                n += 1
+        else:
+            for p in processes:
+                f.write(json.dumps(process_to_record(p)))
+                f.write("\n")
+                n += 1
+    return n
@@ -0,0 +1,103 @@
+# scheduler_tuner.py
+"""Búsqueda del quantum de Round Robin que optimiza un objetivo sobre una carga.
+
+Búsqueda de grueso a fino: se evalúan `points` quantums repartidos en [lo, hi], se
+estrecha el rango alrededor del mejor y se repite hasta que quedan pocos enteros,
+que se evalúan todos. Cada evaluación pasa por la caché de resultados, así que
+repetir la búsqueda (u otra con otro objetivo) sobre la misma carga no vuelve a
+simular. Es una heurística: con objetivos muy irregulares puede quedarse en un
+óptimo local, a cambio de muchas menos simulaciones que un barrido completo.
+
+    python scheduler_tuner.py traza.csv --objective p99_response
+"""
+import argparse, json, sys
+from typing import Dict, List, Optional, Sequence, Tuple
+from scheduler_sim import Process
+from scheduler_cache import ResultCache
+
+OBJECTIVES = ("avg_response", "p99_response", "avg_turnaround", "p99_turnaround", "avg_waiting",
+              "context_switches")
+
+def _grid(lo: int, hi: int, points: int) -> List[int]:
+    if hi - lo + 1 <= points:
+        return list(range(lo, hi + 1))
+    step = (hi - lo) / (points - 1)
+    return sorted({lo + round(i * step) for i in range(points)})
+
+def tune_quantum(processes: Sequence[Process], objective: str = "avg_response", lo: int = 1,
+                 hi: Optional[int] = None, points: int = 6, per_process: str = "keep",
+                 cache: Optional[ResultCache] = None, **config) -> Dict:
+    """Quantum global de RR en [lo, hi] que minimiza `objective` (a igualdad, el menor).
+
+    `hi` por defecto es la ráfaga de CPU más larga: a partir de ahí RR ya no expropia.
+    Con per_process="clear" se ignoran los quantum propios de los procesos. `config`
+    se pasa a la simulación (cpus, switch_cost...).
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Objetivo inválido: {objective!r}")
+    if per_process not in ("keep", "clear"):
+        raise ValueError("per_process debe ser 'keep' o 'clear'")
+    if points < 3:
+        raise ValueError("Se necesitan al menos 3 puntos por ronda")
+    procs = list(processes)
+    if not procs:
+        raise ValueError("La carga está vacía")
+    if per_process == "clear":
+        procs = [Process(p.name, p.burst_time, p.arrival_time, priority=p.priority, bursts=p.bursts, pid=p.pid)
+                 for p in procs]
+    if hi is None:
+        hi = max(max(p.bursts[0::2]) if p.bursts else p.burst_time for p in procs)
+    if not 1 <= lo <= hi:
+        raise ValueError("Se necesita 1 <= lo <= hi")
+    cache = cache if cache is not None else ResultCache()
+    seen: Dict[int, float] = {}
+    history: List[Tuple[int, float]] = []
+
+    def evaluate(q: int) -> float:
+        if q not in seen:
+            seen[q] = cache.run(procs, "RR", q, **config)._compute_metrics()[objective]
+            history.append((q, seen[q]))
+        return seen[q]
+
+    while True:
+        grid = _grid(lo, hi, points)
+        best = min(grid, key=lambda q: (evaluate(q), q))
+        if len(grid) == hi - lo + 1:
+            break
+        # El óptimo está entre los vecinos del mejor punto de la rejilla; si eso no estrecha
+        # el rango (rejilla de 3 con el mejor en medio), se toma la mitad centrada en él
+        i = grid.index(best)
+        nlo, nhi = grid[max(0, i - 1)], grid[min(len(grid) - 1, i + 1)]
+        if (nlo, nhi) == (lo, hi):
+            half = max(1, (hi - lo) // 4)
+            nlo, nhi = max(lo, best - half), min(hi, best + half)
+        lo, hi = nlo, nhi
+    best = min(seen, key=lambda q: (seen[q], q))
+    return {"quantum": best, "objective": objective, "value": seen[best],
+            "evaluations": len(history), "history": history}
+
+def main(argv=None) -> int:
+    from scheduler_trace import read_trace
+    ap = argparse.ArgumentParser(description="Busca el quantum de RR óptimo para una carga")
+    ap.add_argument("workload", help="traza CSV/JSONL")
+    ap.add_argument("--objective", choices=OBJECTIVES, default="avg_response")
+    ap.add_argument("--lo", type=int, default=1)
+    ap.add_argument("--hi", type=int, default=None)
+    ap.add_argument("--points", type=int, default=6, help="quantums evaluados por ronda")
+    ap.add_argument("--per-process", choices=("keep", "clear"), default="keep",
+                    help="respetar o ignorar los quantum propios de la traza")
+    ap.add_argument("--switch-cost", type=int, default=0)
+    ap.add_argument("--cache-dir", default=None)
+    args = ap.parse_args(argv)
+    try:
+        out = tune_quantum(list(read_trace(args.workload)), args.objective, args.lo, args.hi, args.points,
+                           args.per_process, ResultCache(path=args.cache_dir), switch_cost=args.switch_cost)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    json.dump(out, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# scheduler_workload.py
+"""Generador de cargas sintéticas con semilla.
+
+Llegadas de Poisson (intervalos exponenciales) o a ráfagas (alternando una fase
+caliente y otra fría) y duraciones de CPU exponenciales o de cola pesada (Pareto,
+lognormal). Los procesos salen ordenados por llegada, en lotes, así que se pueden
+pasar como iterador a Scheduler o volcar a una traza sin tenerlos todos en memoria:
+
+    python scheduler_workload.py -n 1000000 --rate 0.2 --bursts pareto -o carga.csv
+"""
+import argparse, itertools, math, random, sys
+from typing import Iterator, List, Optional, Sequence
+from scheduler_sim import Process
+from scheduler_trace import write_trace
+
+ARRIVALS = ("poisson", "bursty")
+BURSTS = ("exponential", "pareto", "lognormal")
+
+def _interarrivals(rnd: random.Random, kind: str, rate: float, burstiness: float, phase: float):
+    """Intervalos entre llegadas (en ticks, reales) con media 1/rate."""
+    if kind == "poisson":
+        expo = rnd.expovariate
+        while True:
+            yield expo(rate)
+    else:
+        # Fases de `phase` llegadas en media; la caliente es `burstiness` veces más rápida que
+        # la fría. Las tasas se eligen para que la media global siga siendo `rate`.
+        hot, cold = rate * (1 + burstiness) / 2, rate * (1 + burstiness) / (2 * burstiness)
+        expo, switch = rnd.expovariate, 1 / phase
+        rates = (hot, cold)
+        phase_idx = 0
+        while True:
+            yield expo(rates[phase_idx])
+            if rnd.random() < switch:
+                phase_idx ^= 1
+
+def _burst_sampler(rnd: random.Random, kind: str, mean: float, shape: float):
+    """Muestreador de ráfagas reales > 0 con media `mean`."""
+    if kind == "exponential":
+        return lambda: rnd.expovariate(1 / mean)
+    if kind == "pareto":
+        if shape <= 1:
+            raise ValueError("Pareto necesita forma > 1 para tener media finita")
+        scale = mean * (shape - 1) / shape
+        return lambda: scale * rnd.paretovariate(shape)
+    if kind == "lognormal":
+        mu = math.log(mean) - shape * shape / 2
+        return lambda: rnd.lognormvariate(mu, shape)
+    raise ValueError(f"Distribución de ráfagas inválida: {kind!r}")
+
+def batches(n: Optional[int], seed: Optional[int] = None, rate: float = 0.2, arrivals: str = "poisson",
+            bursts: str = "exponential", mean_burst: float = 5.0, shape: float = 1.5,
+            max_burst: Optional[int] = None, burstiness: float = 10.0, phase: float = 50.0,
+            quanta: Sequence[int] = (), quantum_share: float = 0.0, priorities: int = 1,
+            start: int = 0, batch_size: int = 10000) -> Iterator[List[Process]]:
+    """Lotes de procesos ordenados por llegada; con `n=None` la secuencia no termina.
+
+    Las ráfagas se redondean hacia arriba (mínimo 1) y se recortan a `max_burst`. Una
+    fracción `quantum_share` de procesos lleva quantum propio, elegido de `quanta`.
+    `shape` es la forma de Pareto o la sigma de la lognormal.
+    """
+    if arrivals not in ARRIVALS:
+        raise ValueError(f"Distribución de llegadas inválida: {arrivals!r}")
+    if rate <= 0 or mean_burst <= 0:
+        raise ValueError("La tasa de llegadas y la ráfaga media deben ser > 0")
+    if burstiness < 1 or phase <= 0:
+        raise ValueError("burstiness debe ser >= 1 y phase > 0")
+    if quantum_share and not quanta:
+        raise ValueError("quantum_share necesita una lista de quanta")
+    if priorities < 1 or batch_size < 1:
+        raise ValueError("priorities y batch_size deben ser >= 1")
+    rnd = random.Random(seed)
+    gaps = _interarrivals(rnd, arrivals, rate, burstiness, phase)
+    sample = _burst_sampler(rnd, bursts, mean_burst, shape)
+    ceil, rand, choice, randrange = math.ceil, rnd.random, rnd.choice, rnd.randrange
+    cap = max_burst or sys.maxsize
+    t = float(start)
+    counter = itertools.count() if n is None else iter(range(n))
+    while True:
+        batch = []
+        for i in itertools.islice(counter, batch_size):
+            t += next(gaps)
+            b = min(cap, max(1, ceil(sample())))
+            q = choice(quanta) if quantum_share and rand() < quantum_share else None
+            prio = randrange(priorities) if priorities > 1 else 0
+            batch.append(Process(f"P{i}", b, int(t), quantum=q, priority=prio))
+        if not batch:
+            return
+        yield batch
+
+def generate(n: Optional[int], seed: Optional[int] = None, **options) -> Iterator[Process]:
+    """Procesos de uno en uno (mismas opciones que `batches`); listo para Scheduler(generate(...), ...)."""
+    for batch in batches(n, seed, **options):
+        yield from batch
+
+def _parse_quanta(text: str) -> List[int]:
+    return [int(x) for x in text.split(",") if x]
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Genera una traza sintética ordenada por llegada")
+    ap.add_argument("-n", type=int, required=True, help="número de procesos")
+    ap.add_argument("-o", "--output", required=True, help="traza de salida (.csv o .jsonl)")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--rate", type=float, default=0.2, help="llegadas por tick en media")
+    ap.add_argument("--arrivals", choices=ARRIVALS, default="poisson")
+    ap.add_argument("--burstiness", type=float, default=10.0, help="bursty: tasa caliente / tasa fría")
+    ap.add_argument("--phase", type=float, default=50.0, help="bursty: llegadas por fase en media")
+    ap.add_argument("--bursts", choices=BURSTS, default="exponential")
+    ap.add_argument("--mean-burst", type=float, default=5.0)
+    ap.add_argument("--shape", type=float, default=1.5, help="forma de Pareto o sigma de la lognormal")
+    ap.add_argument("--max-burst", type=int, default=None)
+    ap.add_argument("--quanta", type=_parse_quanta, default=(), help="quanta propios posibles, p. ej. 1,2,4")
+    ap.add_argument("--quantum-share", type=float, default=0.0, help="fracción de procesos con quantum propio")
+    ap.add_argument("--priorities", type=int, default=1, help="número de niveles de prioridad")
+    args = ap.parse_args(argv)
+    try:
+        procs = generate(args.n, args.seed, rate=args.rate, arrivals=args.arrivals, burstiness=args.burstiness,
+                         phase=args.phase, bursts=args.bursts, mean_burst=args.mean_burst, shape=args.shape,
+                         max_burst=args.max_burst, quanta=args.quanta, quantum_share=args.quantum_share,
+                         priorities=args.priorities)
+        write_trace(procs, args.output)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
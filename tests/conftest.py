@@ -0,0 +1,6 @@
+# tests/conftest.py
+# Los módulos del simulador viven en la raíz del repositorio, sin paquete
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
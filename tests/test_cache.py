@@ -0,0 +1,71 @@
+# tests/test_cache.py
+from scheduler_sim import Process, Scheduler
+from scheduler_cache import ResultCache, RunResult, run_key
+from scheduler_sweep import sweep
+from test_engine import io_workload
+
+def view(sim):
+    return (sim.time, sim._compute_metrics(), list(sim.timeline.events()), list(sim.timeline.runs()),
+            sorted((p.pid, p.start_time, p.completion_time, p.waiting_time, p.response_time) for p in sim.finished))
+
+def test_hit_replays_same_run():
+    procs = io_workload(1)
+    cache = ResultCache()
+    first = cache.run(procs, "RR", 2, switch_cost=1)
+    again = cache.run(procs, "RR", 2, switch_cost=1)
+    assert isinstance(again, RunResult)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert view(again) == view(first)
+
+def test_key_ignores_names_pids_and_unused_quantum():
+    a = [Process("a", 3, 0), Process("b", 2, 1)]
+    b = [Process("x", 3, 0), Process("y", 2, 1)]
+    assert run_key(a, "FCFS", 4) == run_key(b, "fcfs", None)
+    assert run_key(a, "RR", 2) != run_key(a, "RR", 3)
+    assert run_key(a, "RR", 2) == run_key(a, "RR", 2, cpus=1, switch_cost=0)
+    assert run_key(a, "RR", 2) != run_key(a, "RR", 2, cpus=2)
+    # El orden de entrada de procesos que llegan a la vez sí cambia la planificación
+    c = [Process("p", 3, 0), Process("q", 5, 0)]
+    assert run_key(c, "FCFS") != run_key(c[::-1], "FCFS")
+
+def test_hit_translates_pids():
+    cache = ResultCache()
+    cache.run([Process("a", 3, 0), Process("b", 2, 1)], "SRTF")
+    procs = [Process("x", 3, 0), Process("y", 2, 1)]
+    hit = cache.run(procs, "SRTF")
+    fresh = Scheduler(procs, "SRTF")
+    fresh.simulate()
+    assert view(hit) == view(fresh)
+
+def test_lru_eviction():
+    cache = ResultCache(maxsize=2)
+    w = [io_workload(s, 5) for s in range(3)]
+    for procs in w:
+        cache.run(procs, "FCFS")
+    assert len(cache) == 2
+    cache.run(w[0], "FCFS")
+    assert cache.misses == 4
+
+def test_disk_tier_and_smp(tmp_path):
+    procs = io_workload(2)
+    first = ResultCache(path=str(tmp_path)).run(procs, "MLFQ", 1, cpus=2, balance="steal")
+    cache = ResultCache(path=str(tmp_path))
+    hit = cache.run(procs, "MLFQ", 1, cpus=2, balance="steal")
+    assert cache.hits == 1
+    assert view(hit) == view(first)
+
+def test_disk_eviction(tmp_path):
+    cache = ResultCache(path=str(tmp_path), disk_maxsize=2)
+    for s in range(4):
+        cache.run(io_workload(s, 5), "FCFS")
+    assert len(list(tmp_path.glob("*.pkl"))) == 2
+
+def test_sweep_reuses_cached_configs():
+    procs = io_workload(3)
+    cache = ResultCache()
+    first = sweep(procs, ["FCFS", "RR"], [1, 2], workers=1, cache=cache)
+    assert cache.misses == 3
+    rows = sweep(procs, ["RR"], [2, 3], workers=1, cache=cache)
+    assert cache.hits == 1
+    assert rows[0] == first[2]
+    assert sweep(procs, ["FCFS", "RR"], [1, 2], workers=1) == first
@@ -0,0 +1,89 @@
+# tests/test_checkpoint.py
+"""seek(t) debe dejar el simulador igual que simular desde cero hasta t."""
+import pytest
+
+from scheduler_sim import Scheduler
+from scheduler_smp import SmpScheduler
+from scheduler_policies import POLICIES, make_policy
+from scheduler_checkpoint import Checkpointer, snapshot
+from scheduler_workload import generate
+from test_engine import POLICY_OPTIONS, io_workload
+
+def state(sim):
+    """Estado observable: reloj, CPU, orden de la cola de listos, restantes y línea de tiempo."""
+    running = sim.cores if hasattr(sim, "cores") else [sim.running]
+    procs = sorted((p.pid, p.remaining_time, p._rr_slice_left, p.io_time, p.start_time)
+                   for p in sim.processes)
+    ready = [[p.pid for p in pol.ready] for pol in getattr(sim, "policies", [sim.policy])]
+    return (sim.time, [p and p.pid for p in running], ready, procs, [p.pid for p in sim.finished],
+            list(sim.timeline.events()), list(sim.timeline.runs()))
+
+@pytest.mark.parametrize("event_driven", [False, True], ids=["tick", "event"])
+@pytest.mark.parametrize("algo", sorted(POLICIES))
+def test_seek_matches_fresh_run(algo, event_driven):
+    procs = io_workload(2)
+    opts = POLICY_OPTIONS.get(algo, {})
+    make = lambda: Scheduler(procs, make_policy(algo, 2, **opts), event_driven=event_driven, switch_cost=1)
+    cp = Checkpointer(make(), every=7)
+    cp.run()
+    assert len(cp.checkpoints) > 3
+    for t in (0, 5, 7, 13, 29, 40, cp.sim.time):
+        fresh = make()
+        fresh.simulate(t)
+        assert state(cp.seek(t)) == state(fresh)
+
+def test_seek_smp_and_save_load(tmp_path):
+    procs = io_workload(4, 30)
+    make = lambda: SmpScheduler(procs, "MLFQ", cpus=2, rr_quantum=1, balance="steal", event_driven=True)
+    cp = Checkpointer(make(), every=10)
+    metrics = cp.run()
+    path = tmp_path / "run.bin"
+    cp.save(path)
+    loaded = Checkpointer.load(path)
+    assert loaded.sim._compute_metrics() == metrics
+    assert list(loaded.sim.timeline.events()) == list(cp.sim.timeline.events())
+    for t in (3, 17, 31):
+        fresh = make()
+        fresh.simulate(t)
+        assert state(loaded.seek(t)) == state(fresh)
+
+def test_seek_does_not_touch_original():
+    cp = Checkpointer(Scheduler(io_workload(1), "RR", rr_quantum=2), every=5)
+    cp.run()
+    events = list(cp.sim.timeline.events())
+    sim = cp.seek(12)
+    sim.simulate()
+    assert list(cp.sim.timeline.events()) == events
+
+def test_streamed_workload_cannot_checkpoint():
+    procs = sorted(io_workload(1), key=lambda p: p.arrival_time)
+    cp = Checkpointer(Scheduler((p for p in procs), "FCFS"))
+    with pytest.raises(ValueError, match="No se puede guardar"):
+        cp.run()
+
+def test_checkpoints_hold_only_dynamic_state():
+    # Carga ligera: pocos procesos vivos a la vez, así que cada checkpoint es pequeño
+    procs = list(generate(20000, 3, rate=0.1))
+    cp = Checkpointer(Scheduler(procs, "RR", rr_quantum=4, event_driven=True), every=5000)
+    cp.run()
+    full = len(snapshot(cp.sim))
+    sizes = [len(c.blob) for c in cp.checkpoints]
+    assert len(sizes) > 10
+    assert max(sizes) < full / 50
+    assert sum(sizes) < full
+
+def test_restored_sim_runs_to_the_same_end():
+    procs = io_workload(6, 40)
+    make = lambda: Scheduler(procs, "MLFQ", rr_quantum=1, event_driven=True)
+    cp = Checkpointer(make(), every=6)
+    cp.run(max_time=30)
+    for t in (0, 14, 30):
+        sim = cp.seek(t)
+        sim.simulate()
+        fresh = make()
+        fresh.simulate()
+        assert state(sim) == state(fresh)
+    # El original no se ha tocado al reanudar las copias
+    partial = make()
+    partial.simulate(30)
+    assert state(cp.sim) == state(partial)
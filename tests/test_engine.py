@@ -0,0 +1,141 @@
+# tests/test_engine.py
+"""Equivalencias del motor: paridad con la versión original y tick a tick frente a eventos.
+
+tests/data/baseline_golden.json se generó con el scheduler_sim.py de la versión
+original (commit "baseline") sobre las mismas cargas de `workload`.
+"""
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from scheduler_sim import Process, Scheduler
+from scheduler_smp import SmpScheduler
+from scheduler_policies import POLICIES, make_policy
+
+GOLDEN = json.loads((Path(__file__).parent / "data" / "baseline_golden.json").read_text())
+
+# Opciones con las que se prueba cada política registrada
+POLICY_OPTIONS = {"PRIO": {"aging": 3}, "PRIO-P": {"aging": 2}, "MLFQ": {"boost": 15}}
+
+def workload(seed, n=20):
+    rnd = random.Random(seed)
+    return [Process(f"P{i}", rnd.randint(1, 12), rnd.randint(0, 40), quantum=rnd.choice([None, None, 1, 3]))
+            for i in range(n)]
+
+def io_workload(seed, n=20):
+    """Mezcla de procesos solo de CPU y procesos con ráfagas de E/S y prioridad."""
+    rnd = random.Random(seed)
+    out = []
+    for i in range(n):
+        prio = rnd.randint(0, 3)
+        if rnd.random() < 0.4:
+            b = [rnd.randint(1, 5) for _ in range(5)]
+            out.append(Process(f"P{i}", sum(b[0::2]), rnd.randint(0, 40), bursts=b, priority=prio))
+        else:
+            out.append(Process(f"P{i}", rnd.randint(1, 9), rnd.randint(0, 40), priority=prio))
+    return out
+
+def trace(sim):
+    """Lo observable de una simulación: métricas, eventos y PID en CPU por tick."""
+    return sim._compute_metrics(), list(sim.timeline.events()), list(sim.timeline.runs())
+
+def run_both(make):
+    out = []
+    for event_driven in (False, True):
+        sim = make(event_driven)
+        sim.simulate(5000)
+        out.append(trace(sim))
+    return out
+
+@pytest.mark.parametrize("event_driven", [False, True], ids=["tick", "event"])
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("algo", ["FCFS", "SJF", "SRTF", "RR"])
+def test_baseline_parity(algo, seed, event_driven):
+    sim = Scheduler(workload(seed), algo, rr_quantum=2, event_driven=event_driven)
+    sim.simulate()
+    golden = GOLDEN[f"{algo}-{seed}"]
+    got = {p.name: [p.start_time, p.completion_time, p.waiting_time, p.turnaround_time, p.response_time]
+           for p in sim.finished}
+    assert got == golden["processes"]
+    names = {p.pid: p.name for p in sim.processes}
+    assert [names.get(run) for _, run in sim.timeline.runs()] == golden["runs"]
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("algo", sorted(POLICIES))
+def test_tick_event_equivalence(algo, seed):
+    procs = io_workload(seed)
+    opts = POLICY_OPTIONS.get(algo, {})
+    tick, event = run_both(lambda ev: Scheduler(procs, make_policy(algo, 2, **opts), event_driven=ev,
+                                                io_devices=2))
+    assert tick == event
+    assert tick[0]["throughput"] > 0
+
+@pytest.mark.parametrize("queues,balance", [("global", None), ("per-cpu", None), ("per-cpu", "steal"),
+                                            ("per-cpu", "push")])
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("algo", sorted(POLICIES))
+def test_smp_tick_event_equivalence(algo, seed, queues, balance):
+    procs = io_workload(seed)
+    opts = POLICY_OPTIONS.get(algo, {})
+    tick, event = run_both(lambda ev: SmpScheduler(procs, algo, cpus=3, rr_quantum=2, queues=queues,
+                                                   balance=balance, balance_interval=3, event_driven=ev, **opts))
+    assert tick == event
+
+def test_push_balance_skipped_point_matches_tick():
+    # El motor por eventos salta t=3 y t=6 con las colas vacías; no debe balancear fuera de intervalo
+    procs = [Process("p0", 4, 1), Process("p1", 6, 4), Process("p2", 4, 8), Process("p3", 3, 8)]
+    tick, event = run_both(lambda ev: SmpScheduler(procs, "FCFS", cpus=2, balance="push", balance_interval=3,
+                                                   event_driven=ev))
+    assert tick == event
+
+@pytest.mark.parametrize("balance", ["steal", "push"])
+def test_mlfq_level_survives_migration(balance):
+    sim = SmpScheduler(io_workload(3, 40), "MLFQ", cpus=3, rr_quantum=1, balance=balance, balance_interval=2)
+    sim.simulate()
+    assert len(sim.finished) == 40
+    # Ningún nivel queda huérfano en la política de otra CPU
+    assert all(not pol._level for pol in sim.policies)
+
+def test_mlfq_migrate_keeps_level():
+    src, dst = make_policy("MLFQ", 2), make_policy("MLFQ", 2)
+    p = Process("a", 10, 0)
+    src._level[p.pid] = 2
+    src.migrate(p, dst)
+    assert p.pid not in src._level
+    assert dst._level[p.pid] == 2
+    assert dst.ready.best_level() == 2
+
+@pytest.mark.parametrize("event_driven", [False, True], ids=["tick", "event"])
+@pytest.mark.parametrize("algo", ["SRTF", "PRIO-P", "MLFQ"])
+def test_global_queue_idle_core_takes_arrival(algo, event_driven):
+    # b llega con la CPU 1 libre: la CPU 0 no debe expropiar a `a` para que migre a la 1
+    procs = [Process("a", 10, 0, priority=2), Process("b", 5, 3, priority=1)]
+    sim = SmpScheduler(procs, algo, cpus=2, rr_quantum=20, queues="global", switch_cost=1,
+                       event_driven=event_driven)
+    sim.simulate()
+    assert not [e for e in sim.timeline.events() if e[1] == "preempt"]
+    assert sim.switches == 2
+    assert {(pid, c) for _, kind, pid, c in sim.timeline.events() if kind == "switch"} == \
+        {(sim.processes[0].pid, 0), (sim.processes[1].pid, 1)}
+
+@pytest.mark.parametrize("algo", sorted(POLICIES))
+def test_single_cpu_smp_matches_scheduler(algo):
+    procs = io_workload(7)
+    opts = POLICY_OPTIONS.get(algo, {})
+    sim = Scheduler(procs, make_policy(algo, 2, **opts), event_driven=True)
+    smp = SmpScheduler(procs, algo, cpus=1, rr_quantum=2, event_driven=True, **opts)
+    expected = sim.simulate()
+    got = smp.simulate()
+    got.pop("cpu0_utilization")
+    assert got == expected
+    assert [(t, k, pid) for t, k, pid, _ in smp.timeline.events()] == list(sim.timeline.events())
+
+def test_engine_import_skips_asyncio():
+    # Los lotes sin GUI no deben pagar la importación de asyncio
+    import subprocess, sys
+    code = "import sys, scheduler_sim, scheduler_cli; print('asyncio' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                         cwd=Path(__file__).resolve().parent.parent)
+    assert out.stdout.strip() == "False"
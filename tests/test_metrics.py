@@ -0,0 +1,43 @@
+# tests/test_metrics.py
+from types import SimpleNamespace
+
+import pytest
+
+from scheduler_sim import Process, Scheduler
+from scheduler_metrics import compute_metrics, percentile
+
+def test_percentile_interpolates():
+    vals = [10, 20, 30, 40, 50]
+    assert percentile(vals, 50) == 30
+    assert percentile(vals, 95) == pytest.approx(48)      # pos 3,8: 40 + 0,8·10
+    assert percentile(vals, 100) == 50
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) == 0.0
+
+def test_compute_metrics_values():
+    done = [SimpleNamespace(waiting_time=w, turnaround_time=w + 2, response_time=w) for w in range(20)]
+    m = compute_metrics(done, makespan=40, busy=30, per_cpu=[20, 10], io_busy=[8], switches=5, overhead=4)
+    assert m["avg_waiting"] == pytest.approx(9.5)
+    assert m["p50_waiting"] == pytest.approx(9.5)
+    assert m["p95_waiting"] == pytest.approx(18.05)
+    assert m["p99_turnaround"] == pytest.approx(20.81)
+    assert m["max_response"] == 19
+    assert m["throughput"] == pytest.approx(20 / 40)
+    assert m["cpu_utilization"] == pytest.approx(30 / 80)
+    assert (m["cpu0_utilization"], m["cpu1_utilization"]) == (0.5, 0.25)
+    assert m["io_utilization"] == m["io0_utilization"] == pytest.approx(0.2)
+    assert m["context_switches"] == 5
+    assert m["overhead_fraction"] == pytest.approx(4 / 80)
+
+def test_empty_run():
+    m = compute_metrics([], makespan=0, busy=0)
+    assert m["avg_waiting"] == m["p99_response"] == m["throughput"] == m["cpu_utilization"] == 0
+
+def test_simulation_metrics_by_hand():
+    # FCFS: a 0-4, hueco 4-6, b 6-8, c 8-9 -> esperas 0, 0, 1
+    sim = Scheduler([Process("a", 4, 0), Process("b", 2, 6), Process("c", 1, 7)], "FCFS")
+    m = sim.simulate()
+    assert m["avg_waiting"] == pytest.approx(1 / 3)
+    assert m["p50_turnaround"] == 2
+    assert m["throughput"] == pytest.approx(3 / 9)
+    assert m["cpu_utilization"] == pytest.approx(7 / 9)
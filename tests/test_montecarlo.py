@@ -0,0 +1,50 @@
+# tests/test_montecarlo.py
+import pytest
+
+from scheduler_montecarlo import Replicator, confidence_interval, replicate, replication_seed, t_quantile
+
+WORKLOAD = {"n": 60, "rate": 0.15}
+
+@pytest.mark.parametrize("df,expected", [(1, 12.706), (2, 4.303), (3, 3.182), (5, 2.571), (10, 2.228), (60, 2.000)])
+def test_t_quantile(df, expected):
+    assert t_quantile(0.975, df) == pytest.approx(expected, rel=0.005)
+
+def test_confidence_interval():
+    mean, half = confidence_interval([1.0, 2.0, 3.0, 4.0, 5.0])
+    assert mean == 3.0
+    assert half == pytest.approx(2.776 * 1.5811 / 5 ** 0.5, rel=1e-3)
+
+def test_stops_early_at_target():
+    loose = replicate("RR", 3, workers=1, target=0.25, relative=True, batch=4, workload=WORKLOAD, max_reps=400)
+    assert loose["converged"]
+    assert loose["replications"] < 400
+    assert loose["half_width"] <= 0.25 * loose["mean"]
+    assert loose["low"] < loose["mean"] < loose["high"]
+    tight = replicate("RR", 3, workers=1, target=0.05, relative=True, batch=4, workload=WORKLOAD, max_reps=400)
+    assert tight["replications"] > loose["replications"]
+
+def test_without_target_runs_max_reps():
+    out = replicate("FCFS", workers=1, metric="p95_response", max_reps=12, min_reps=5, workload=WORKLOAD)
+    assert out["replications"] == 12
+    assert not out["converged"]
+    assert set(out["means"]) >= {"avg_waiting", "p95_response", "throughput"}
+
+def test_pool_reuse_matches_serial():
+    serial = replicate("SRTF", workers=1, target=1.0, batch=6, workload=WORKLOAD, max_reps=60)
+    with Replicator(2) as rep:
+        first = rep.run("SRTF", target=1.0, batch=6, workload=WORKLOAD, max_reps=60)
+        again = rep.run("MLFQ", 2, workload=WORKLOAD, max_reps=6, min_reps=6, cpus=2)
+    assert first == serial
+    assert again["replications"] == 6
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        replicate("FCFS", workers=1, metric="nope", max_reps=4, min_reps=2, workload=WORKLOAD)
+    with pytest.raises(ValueError):
+        replicate("FCFS", workers=1, min_reps=1)
+
+def test_nearby_base_seeds_do_not_share_replications():
+    a = {replication_seed(0, i) for i in range(1000)}
+    b = {replication_seed(1, i) for i in range(1000)}
+    assert len(a) == 1000 and not a & b
+    assert replication_seed(0, 5) == replication_seed(0, 5)
@@ -0,0 +1,68 @@
+# tests/test_overhead.py
+"""Coste de cambio de contexto: terminación, ventana no expropiable y equivalencia de motores."""
+import pytest
+
+from scheduler_sim import Process, Scheduler
+from scheduler_smp import SmpScheduler
+from scheduler_policies import POLICIES, make_policy
+from scheduler_timeline import OVERHEAD
+from test_engine import POLICY_OPTIONS, io_workload, run_both
+
+@pytest.mark.parametrize("event_driven", [False, True], ids=["tick", "event"])
+def test_srtf_tie_does_not_livelock(event_driven):
+    sim = Scheduler([Process("a", 3, 0), Process("b", 3, 0)], "SRTF", switch_cost=1, event_driven=event_driven)
+    m = sim.simulate(200)
+    assert len(sim.finished) == 2
+    assert sim.time == 8
+    assert m["context_switches"] == 2
+    assert m["overhead_fraction"] == 0.25
+
+@pytest.mark.parametrize("aging", [1, 2, 3])
+def test_prio_p_aging_below_cost_terminates(aging):
+    procs = [Process("a", 6, 0, priority=1), Process("b", 6, 0, priority=2), Process("c", 6, 1, priority=0)]
+    sim = Scheduler(procs, make_policy("PRIO-P", aging=aging), switch_cost=2, warmup_cost=1)
+    sim.simulate(500)
+    assert len(sim.finished) == 3
+
+def test_srtf_preempts_only_when_gain_exceeds_cost():
+    # b ahorra 7 ticks a a: con coste 2 compensa expropiar; c (llega con a a 8 ticks) solo ahorra 1
+    procs = [Process("a", 10, 0), Process("b", 2, 1), Process("c", 7, 10)]
+    sim = Scheduler(procs, "SRTF", switch_cost=2)
+    sim.simulate()
+    order = [pid for _, kind, pid in sim.timeline.events() if kind == "dispatch"]
+    pids = {p.name: p.pid for p in sim.processes}
+    assert order == [pids["a"], pids["b"], pids["a"], pids["c"]]
+
+def test_switch_window_is_not_preemptible():
+    # b llega a mitad del cambio hacia a: a debe llegar a ejecutar un tick antes de ceder la CPU
+    procs = [Process("a", 5, 0, priority=3), Process("b", 2, 1, priority=0)]
+    sim = Scheduler(procs, make_policy("PRIO-P"), switch_cost=2)
+    sim.simulate()
+    runs = [run for _, run in sim.timeline.runs()]
+    a, b = (p.pid for p in sim.processes)
+    assert runs[:5] == [OVERHEAD, OVERHEAD, a, OVERHEAD, OVERHEAD]
+    assert runs[5:7] == [b, b]
+
+def test_zero_cost_matches_plain_engine():
+    procs = io_workload(1)
+    plain = Scheduler(procs, "SRTF", event_driven=True)
+    costed = Scheduler(procs, "SRTF", event_driven=True, switch_cost=0, warmup_cost=0)
+    a, b = plain.simulate(), costed.simulate()
+    assert a == b
+    assert list(plain.timeline.events()) == list(costed.timeline.events())
+
+@pytest.mark.parametrize("costs", [(1, 0), (2, 1), (3, 2)])
+@pytest.mark.parametrize("algo", sorted(POLICIES))
+def test_overhead_tick_event_equivalence(algo, costs):
+    procs = io_workload(5)
+    opts = POLICY_OPTIONS.get(algo, {})
+    sc, wc = costs
+    tick, event = run_both(lambda ev: Scheduler(procs, make_policy(algo, 2, **opts), event_driven=ev,
+                                                switch_cost=sc, warmup_cost=wc))
+    assert tick == event
+    m = tick[0]
+    assert m["overhead_fraction"] > 0
+    assert m["cpu_utilization"] + m["overhead_fraction"] <= 1
+    smp = run_both(lambda ev: SmpScheduler(procs, algo, cpus=2, rr_quantum=2, balance="steal", event_driven=ev,
+                                           switch_cost=sc, warmup_cost=wc, **opts))
+    assert smp[0] == smp[1]
@@ -0,0 +1,79 @@
+# tests/test_policies.py
+"""Comportamiento de las políticas en casos pequeños calculados a mano."""
+from scheduler_sim import Process, Scheduler
+
+def order(sim):
+    """PID -> nombre, y nombres en el orden en que entran en la CPU."""
+    names = {p.pid: p.name for p in sim.processes}
+    return [names[pid] for _, kind, pid in sim.timeline.events() if kind == "dispatch"]
+
+def test_sjf_uses_current_cpu_burst():
+    # a suma 6 ticks de CPU, pero su ráfaga actual (2) es más corta que la de b (4)
+    procs = [Process("c", 3, 0), Process("a", 6, 1, bursts=(2, 5, 2, 5, 2)), Process("b", 4, 1),
+             Process("d", 3, 9), Process("e", 3, 11)]
+    sim = Scheduler(procs, "SJF")
+    sim.simulate()
+    # t=3: a (2) antes que b (4); t=12: a, de vuelta de E/S con 2, antes que e (3)
+    assert order(sim)[:6] == ["c", "a", "b", "d", "a", "e"]
+    for event_driven in (False, True):
+        other = Scheduler(procs, "SJF", event_driven=event_driven)
+        other.simulate()
+        assert order(other) == order(sim)
+
+def events(procs, algo, quantum=None, **options):
+    """(instante, evento, nombre) en ambos motores; deben coincidir."""
+    from scheduler_policies import make_policy
+    out = []
+    for event_driven in (False, True):
+        sim = Scheduler(procs, make_policy(algo, quantum, **options), event_driven=event_driven)
+        sim.simulate()
+        names = {p.pid: p.name for p in sim.processes}
+        out.append([(t, kind, names[pid]) for t, kind, pid in sim.timeline.events()])
+    assert out[0] == out[1]
+    return out[0]
+
+def dispatches(evs):
+    return [(t, name) for t, kind, name in evs if kind == "dispatch"]
+
+def preempts(evs, name):
+    return [t for t, kind, n in evs if kind == "preempt" and n == name]
+
+def test_prio_aging_lets_old_process_overtake():
+    # En t=6 `a` ha esperado 6 ticks: 3 - 6//2 = 0 mejora la prioridad 1 de `b` (1 - 1//2)
+    procs = [Process("x", 6, 0, priority=0), Process("a", 1, 0, priority=3), Process("b", 1, 5, priority=1)]
+    assert [n for _, n in dispatches(events(procs, "PRIO", aging=2))] == ["x", "a", "b"]
+    assert [n for _, n in dispatches(events(procs, "PRIO"))] == ["x", "b", "a"]
+
+def test_prio_p_aging_preempts_when_aged_below_running():
+    # `a` (3) baja a 0 < 1 en t=6 y expropia a `c`; con prioridad 1 en t=2 y t=4 empata y espera
+    procs = [Process("c", 10, 0, priority=1), Process("a", 1, 0, priority=3)]
+    evs = events(procs, "PRIO-P", aging=2)
+    assert (6, "a") in dispatches(evs)
+    assert preempts(evs, "c") == [6]
+    assert preempts(events(procs, "PRIO-P"), "c") == []
+
+def test_mlfq_demotes_on_quantum_expiry():
+    # quanta 2, 4, 8: x agota el nivel 0 en t=2, y (nivel 0) lo expropia en t=3 sin bajarlo,
+    # x termina el resto de su quantum de nivel 1 (3 ticks) en t=7 y acaba en el nivel 2
+    procs = [Process("x", 10, 0), Process("y", 1, 3)]
+    evs = events(procs, "MLFQ", 2)
+    assert preempts(evs, "x") == [2, 3, 7]
+    assert (3, "y") in dispatches(evs)
+    assert (11, "complete", "x") in evs
+
+def test_mlfq_keeps_level_across_io():
+    # z baja al nivel 1 en t=2 y se bloquea en t=3; al volver en t=5 sigue en el nivel 1
+    # (quantum 4) y acaba su ráfaga de 3 sin expropiación; en el nivel 0 la tendría en t=7
+    procs = [Process("z", 6, 0, bursts=(3, 2, 3))]
+    evs = events(procs, "MLFQ", 2)
+    assert preempts(evs, "z") == [2]
+    assert (8, "complete", "z") in evs
+
+def test_mlfq_periodic_boost():
+    # quanta 1, 2, 4: sin boost x expira en 1, 3, 7, 11, 15, 19; el boost de t=10 lo devuelve
+    # al nivel 0 con quantum 1 y vuelve a bajar: 11, 13, 17
+    procs = [Process("x", 20, 0)]
+    assert preempts(events(procs, "MLFQ", 1), "x") == [1, 3, 7, 11, 15, 19]
+    evs = events(procs, "MLFQ", 1, boost=10)
+    assert preempts(evs, "x") == [1, 3, 7, 11, 13, 17]
+    assert (20, "complete", "x") in evs
@@ -0,0 +1,85 @@
+# tests/test_profile.py
+import json
+import pickle
+
+import pytest
+
+from scheduler_sim import Scheduler
+from scheduler_smp import SmpScheduler
+from scheduler_policies import POLICIES, make_policy
+from scheduler_profile import PHASES, Profiler, format_report, profile
+from scheduler_cli import main as cli_main
+from test_engine import POLICY_OPTIONS, io_workload, trace
+
+WORKLOAD = io_workload(0)
+
+def make(algo, event_driven, cpus=1):
+    opts = POLICY_OPTIONS.get(algo, {})
+    if cpus > 1:
+        return SmpScheduler(WORKLOAD, algo, cpus=cpus, rr_quantum=2, balance="push",
+                            balance_interval=4, event_driven=event_driven, **opts)
+    return Scheduler(WORKLOAD, make_policy(algo, 2, **opts), event_driven=event_driven, switch_cost=1)
+
+@pytest.mark.parametrize("cpus", [1, 3])
+@pytest.mark.parametrize("event_driven", [False, True], ids=["tick", "event"])
+@pytest.mark.parametrize("algo", sorted(POLICIES))
+def test_profiler_does_not_change_results(algo, event_driven, cpus):
+    plain = make(algo, event_driven, cpus)
+    plain.simulate()
+    sim = make(algo, event_driven, cpus)
+    _, prof = profile(sim)
+    assert trace(sim) == trace(plain)
+    rep = prof.report()
+    assert rep["ticks"] == sim.time == sum(rep["queue_length"].values())
+    assert set(rep["phases"]) <= set(PHASES)
+    # Toda expropiación registrada viene de select o de un fin de quantum
+    preempts = sum(e[1] == "preempt" for e in sim.timeline.events())
+    assert rep["counters"]["preemptions"] + rep["counters"]["expirations"] == preempts
+    assert rep["counters"]["selections"] == rep["phases"]["select"]["calls"]
+
+@pytest.mark.parametrize("algo", ["SRTF", "RR", "MLFQ"])
+def test_queue_histogram_matches_between_engines(algo):
+    reps = [profile(make(algo, ev))[1].report() for ev in (False, True)]
+    assert reps[0]["queue_length"] == reps[1]["queue_length"]
+    assert reps[0]["counters"]["preemptions"] == reps[1]["counters"]["preemptions"]
+    assert reps[0]["counters"]["expirations"] == reps[1]["counters"]["expirations"]
+
+def test_detach_restores_class_methods():
+    sim = make("MLFQ", True, cpus=2)
+    with Profiler(sim) as prof:
+        sim.simulate(20)
+        with pytest.raises(ValueError):
+            prof.attach()
+    assert not {"step", "_admit", "_dispatch", "_end_tick", "_wake", "_rebalance"} & set(vars(sim))
+    assert all("select" not in vars(pol) for pol in sim.policies)
+    pickle.dumps(sim)     # serializable de nuevo (checkpoints)
+    steps = prof.steps
+    sim.simulate()
+    assert prof.steps == steps
+
+def test_tracer_and_cprofile(tmp_path):
+    spans = []
+    sim = make("RR", True)
+    _, prof = profile(sim, cprofile=True, tracer=lambda phase, t0, dt: spans.append((phase, dt)))
+    rep = prof.report(top=5)
+    assert {p for p, _ in spans} == set(rep["phases"])
+    assert sum(dt for p, dt in spans if p == "run") / 1e9 == pytest.approx(rep["phases"]["run"]["seconds"])
+    assert len(rep["functions"]) == 5
+    assert "step" in prof.stats(limit=5)
+    prof.dump(str(tmp_path / "run.pstats"))
+    assert (tmp_path / "run.pstats").stat().st_size > 0
+    with pytest.raises(ValueError):
+        profile(make("RR", True))[1].stats()
+
+def test_cli_profile(tmp_path, capsys):
+    trace_file = tmp_path / "w.csv"
+    trace_file.write_text("name,burst,arrival\nA,5,0\nB,3,1\nC,8,2\n")
+    assert cli_main([str(trace_file), "-a", "SRTF", "--profile"]) == 0
+    doc = json.loads(capsys.readouterr().out)
+    assert doc["profile"]["counters"]["preemptions"] == 1
+    assert doc["profile"]["ticks"] == doc["metrics"]["time"]
+    assert cli_main([str(trace_file), "--profile", "--save-run", str(tmp_path / "run.bin")]) == 2
+
+def test_format_report_summarises_phases():
+    text = format_report(profile(make("RR", True))[1].report())
+    assert "dispatch" in text and "fines de quantum" in text and "Cola de listos" in text
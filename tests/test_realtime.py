@@ -0,0 +1,120 @@
+# tests/test_realtime.py
+"""Pacer y bucles de tiempo real con un reloj falso: sin esperas reales."""
+import asyncio
+import math
+
+import pytest
+
+from scheduler_sim import Process, Scheduler
+from scheduler_realtime import Pacer, run_realtime, run_scheduled
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+def procs():
+    return [Process("a", 3, 0), Process("b", 2, 1), Process("c", 4, 6)]
+
+def test_speed_limits():
+    clock = FakeClock()
+    for bad in (0.001, 0, 101):
+        with pytest.raises(ValueError):
+            Pacer(1, speed=bad, clock=clock)
+    pacer = Pacer(1, clock=clock)
+    with pytest.raises(ValueError):
+        pacer.set_speed(1000)
+    assert pacer.speed == 1.0
+
+def test_position_and_set_speed_reanchors():
+    clock = FakeClock()
+    pacer = Pacer(5, speed=2, clock=clock).start(3)
+    clock.now += 10
+    assert pacer.position() == pytest.approx(3 + 10 * 2 / 5)
+    # El tramo ya recorrido se conserva; solo cambia el ritmo desde ahora
+    pacer.set_speed(4)
+    assert pacer.position() == pytest.approx(7)
+    clock.now += 5
+    assert pacer.position() == pytest.approx(7 + 5 * 4 / 5)
+
+def test_pause_and_resume():
+    clock = FakeClock()
+    pacer = Pacer(1, clock=clock).start()
+    clock.now += 2
+    pacer.pause()
+    clock.now += 50
+    assert pacer.position() == pytest.approx(2)
+    assert not pacer.due(2.5)
+    assert pacer.delay_until(3) == math.inf
+    pacer.resume()
+    assert pacer.position() == pytest.approx(2)
+    clock.now += 1
+    assert pacer.due(3)
+
+def test_no_drift_after_late_wakeups():
+    clock = FakeClock()
+    pacer = Pacer(1, speed=2, clock=clock).start()
+    for t in range(1, 20):
+        # Cada despertar llega 0,1 s tarde; la espera siguiente lo compensa
+        clock.now += pacer.delay_until(t) + 0.1
+    assert pacer.delay_until(20) == pytest.approx(max(0.0, 20 / 2 - (clock.now - 100)))
+    assert pacer.position() == pytest.approx(19 + 0.2)
+
+def expected(algo="RR"):
+    sim = Scheduler(procs(), algo, rr_quantum=2)
+    return sim.simulate()
+
+def test_run_realtime_gathers_paced_sims(monkeypatch):
+    clock = FakeClock()
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        clock.now += delay
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    sims = [Scheduler(procs(), "RR", rr_quantum=2), Scheduler(procs(), "SRTF")]
+    pacers = [Pacer(1, speed=1, clock=clock), Pacer(1, speed=2, clock=clock)]
+    order = []
+
+    def on_step(sim):
+        # Cada paso empieza cuando el ritmo lo permite
+        pacer = pacers[sims.index(sim)]
+        assert pacer.position() >= sim.time - 1
+        order.append(sims.index(sim))
+
+    async def main():
+        return await asyncio.gather(*(run_realtime(s, p, on_step=on_step, poll=0.25) for s, p in zip(sims, pacers)))
+
+    results = asyncio.run(main())
+    assert results == [expected("RR"), expected("SRTF")]
+    # Las dos avanzan intercaladas en el mismo bucle
+    assert order != sorted(order)
+
+def test_run_scheduled_steps_on_callbacks():
+    clock = FakeClock()
+    pending, done = [], []
+    schedule = lambda ms, fn: pending.append((ms, fn))
+    sim = Scheduler(procs(), "RR", rr_quantum=2)
+    pacer = Pacer(1, speed=4, clock=clock)
+    run_scheduled(schedule, sim, pacer, on_done=done.append, poll=0.25)
+    paused_at = None
+    while not done:
+        ms, fn = pending.pop()
+        assert 1 <= ms <= 250
+        clock.now += ms / 1000
+        if sim.time == 5 and paused_at is None:
+            pacer.pause()
+            paused_at = clock.now
+        elif paused_at is not None and pacer.paused:
+            # En pausa no avanza; se reanuda tras dos revisiones
+            assert sim.time == 5
+            if clock.now - paused_at >= 0.5: pacer.resume()
+        fn()
+    assert not pending
+    assert done == [sim]
+    assert sim._compute_metrics() == expected()
+    # Tiempo de pared: la simulación a 4x más lo que duró la pausa
+    assert clock.now - 100 == pytest.approx(sim.time / 4 + 0.5, abs=0.01)
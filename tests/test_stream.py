@@ -0,0 +1,67 @@
+# tests/test_stream.py
+import random
+import tracemalloc
+
+import pytest
+
+from scheduler_sim import Scheduler
+from scheduler_smp import SmpScheduler
+from scheduler_metrics import compute_metrics
+from scheduler_stream import OpenSystem, P2Quantile
+from scheduler_workload import generate
+
+@pytest.mark.parametrize("q", [0.5, 0.95, 0.99])
+def test_p2_tracks_exact_quantile(q):
+    rnd = random.Random(1)
+    vals = [rnd.expovariate(0.2) for _ in range(50000)]
+    est = P2Quantile(q)
+    for v in vals:
+        est.add(v)
+    exact = sorted(vals)[int(q * (len(vals) - 1))]
+    assert est.value() == pytest.approx(exact, rel=0.05)
+
+def test_p2_small_samples_are_exact():
+    est = P2Quantile(0.5)
+    for v in (5, 1, 3):
+        est.add(v)
+    assert est.value() == 3
+
+def test_windows_add_up_to_closed_run():
+    procs = list(generate(3000, 2, rate=0.15))
+    closed = Scheduler(procs, "RR", rr_quantum=3, event_driven=True)
+    closed.simulate()
+    reports = list(OpenSystem(Scheduler(iter(procs), "RR", rr_quantum=3, event_driven=True), 500).reports())
+    assert [r["time"] for r in reports[:-1]] == list(range(500, len(reports) * 500, 500))
+    assert reports[-1]["time"] == closed.time
+    assert sum(r["completed"] for r in reports) == reports[-1]["total_completed"] == 3000
+    total_wait = sum(r["avg_waiting"] * r["completed"] for r in reports)
+    exact = compute_metrics(closed.finished, closed.time, closed.busy)
+    assert total_wait / 3000 == pytest.approx(exact["avg_waiting"])
+    # P² es aproximado; con esperas enteras y carga no estacionaria basta con el orden de magnitud
+    assert reports[-1]["p95_waiting"] == pytest.approx(exact["p95_waiting"], rel=0.2)
+    assert reports[-1]["in_system"] == 0
+
+def test_smp_open_system():
+    sim = SmpScheduler(generate(None, 4, rate=0.5), "SRTF", cpus=3, event_driven=True)
+    reports = list(OpenSystem(sim, 1000).reports(5000))
+    assert len(reports) == 5
+    assert all(0 < r["cpu_utilization"] <= 1 for r in reports)
+
+def test_memory_stays_bounded():
+    sim = Scheduler(generate(None, 9, rate=0.15, batch_size=256), "RR", rr_quantum=4, event_driven=True)
+    reports = OpenSystem(sim, 5000).reports()
+    next(reports)
+    tracemalloc.start()
+    next(reports)
+    first = tracemalloc.get_traced_memory()[1]
+    for _ in range(4):
+        rep = next(reports)
+    second = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert rep["total_completed"] > 3000
+    # Cuatro veces más ticks no deben pedir más memoria que un intervalo
+    assert second < first + 100_000
+
+def test_requires_iterator():
+    with pytest.raises(ValueError):
+        OpenSystem(Scheduler(list(generate(10, 1)), "FCFS"))
@@ -0,0 +1,21 @@
+# tests/test_sweep.py
+import scheduler_sweep
+from scheduler_sim import Scheduler
+from scheduler_sweep import configs, sweep
+from test_engine import io_workload
+
+def test_pool_matches_serial_and_direct_runs(monkeypatch):
+    pools = []
+    real = scheduler_sweep.ProcessPoolExecutor
+    monkeypatch.setattr(scheduler_sweep, "ProcessPoolExecutor", lambda **kw: pools.append(kw) or real(**kw))
+    procs = io_workload(5, 30)
+    serial = sweep(procs, ["FCFS", "SRTF", "RR", "MLFQ"], [1, 3], workers=1)
+    assert not pools
+    pooled = sweep(procs, ["FCFS", "SRTF", "RR", "MLFQ"], [1, 3], workers=3)
+    assert [kw["max_workers"] for kw in pools] == [3]
+    assert pooled == serial
+    # Mismo orden que la rejilla y mismas métricas que una simulación directa
+    assert [(r["algorithm"], r["quantum"]) for r in pooled] == configs(["FCFS", "SRTF", "RR", "MLFQ"], [1, 3])
+    for row in pooled:
+        sim = Scheduler(procs, row["algorithm"], rr_quantum=row["quantum"])
+        assert {k: v for k, v in row.items() if k not in ("algorithm", "quantum")} == sim.simulate()
@@ -0,0 +1,38 @@
+# tests/test_timeline.py
+from scheduler_sim import Scheduler
+from scheduler_smp import SmpScheduler
+from test_engine import io_workload
+
+def merge(spans):
+    out = []
+    for s, e, pid in spans:
+        if out and out[-1][1] == s and out[-1][2] == pid:
+            out[-1] = (out[-1][0], e, pid)
+        else:
+            out.append((s, e, pid))
+    return out
+
+def test_cursor_yields_only_new_rows_and_spans():
+    sim = Scheduler(io_workload(2), "RR", rr_quantum=2, switch_cost=1, event_driven=True)
+    rows, spans = sim.timeline.cursor(), sim.timeline.cursor()
+    got_rows, got_spans = [], []
+    while sim.step():
+        new = list(rows.rows())
+        # Solo los ticks que el motor acaba de cerrar
+        assert [r[0] for r in new] == list(range(len(got_rows), sim.timeline.end))
+        got_rows += new
+        got_spans += list(spans.spans())
+        assert list(rows.rows()) == [] and list(spans.spans()) == []
+    assert got_rows == list(sim.timeline.rows())
+    assert merge(got_spans) == merge(sim.timeline.cursor().spans())
+
+def test_lane_cursor_is_incremental():
+    sim = SmpScheduler(io_workload(4), "SRTF", cpus=2, event_driven=True)
+    lanes = [sim.timeline.lane(c).cursor() for c in range(2)]
+    got = [[], []]
+    while sim.step():
+        for c, cur in enumerate(lanes):
+            got[c] += list(cur.runs())
+    for c in range(2):
+        assert got[c] == list(sim.timeline.lane(c).runs())
+        assert got[c] == [(t, run[c]) for t, run in sim.timeline.runs()]
@@ -0,0 +1,45 @@
+# tests/test_trace.py
+import pytest
+
+from scheduler_sim import Scheduler
+from scheduler_trace import read_trace
+
+def write(path, rows):
+    path.write_text("name,burst,arrival,bursts\n" + "".join(f"{r}\n" for r in rows))
+    return str(path)
+
+def test_trace_is_consumed_as_time_advances(tmp_path):
+    path = write(tmp_path / "w.csv", [f"P{i},2,{10 * i}," for i in range(100)] + ["IO,3,1000,1 4 2"])
+    read = []
+    def counted():
+        for p in read_trace(path):
+            read.append(p.name)
+            yield p
+    sim = Scheduler(counted(), "FCFS", event_driven=True)
+    assert sim.processes is None
+    assert read == ["P0"]
+    sim.simulate(max_time=55)
+    # Solo las llegadas hasta t=55 más la siguiente pendiente
+    assert read == [f"P{i}" for i in range(7)]
+    sim.simulate()
+    assert len(sim.finished) == 101
+    io = next(p for p in sim.finished if p.name == "IO")
+    assert io.bursts == (1, 4, 2) and io.io_time == 4
+
+def test_unsorted_trace_raises_on_admit(tmp_path):
+    path = write(tmp_path / "w.csv", ["A,2,0,", "B,2,5,", "C,1,3,"])
+    sim = Scheduler(read_trace(path), "FCFS")
+    with pytest.raises(ValueError, match="ordenada por llegada"):
+        sim.simulate()
+    # Una lista sí se ordena
+    sim = Scheduler(list(read_trace(path)), "FCFS")
+    sim.simulate()
+    assert [p.name for p in sim.finished] == ["A", "C", "B"]
+
+def test_jsonl_and_bad_format(tmp_path):
+    path = tmp_path / "w.jsonl"
+    path.write_text('{"name": "A", "burst": 3, "arrival": 0, "quantum": 2}\n\n{"name": "B", "bursts": [1, 2, 1], "arrival": 1, "priority": 4}\n')
+    a, b = read_trace(str(path))
+    assert (a.quantum, b.burst_time, b.priority) == (2, 2, 4)
+    with pytest.raises(ValueError):
+        next(read_trace(str(tmp_path / "w.txt")))
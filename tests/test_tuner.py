@@ -0,0 +1,61 @@
+# tests/test_tuner.py
+import pytest
+
+from scheduler_sim import Process
+from scheduler_cache import ResultCache
+from scheduler_tuner import OBJECTIVES, tune_quantum
+from scheduler_workload import generate
+
+def brute_force(procs, objective, cache, hi, **config):
+    vals = {q: cache.run(procs, "RR", q, **config)._compute_metrics()[objective] for q in range(1, hi + 1)}
+    return min(vals.values())
+
+@pytest.mark.parametrize("objective", OBJECTIVES)
+@pytest.mark.parametrize("seed", range(3))
+def test_close_to_brute_force_with_fewer_runs(objective, seed):
+    procs = list(generate(120, seed, rate=0.18, bursts="pareto", max_burst=40))
+    cache = ResultCache(maxsize=1000)
+    res = tune_quantum(procs, objective, cache=cache, switch_cost=1)
+    hi = max(p.burst_time for p in procs)
+    assert res["evaluations"] < hi / 2
+    # Heurística: cerca del óptimo del barrido completo, nunca por debajo
+    best = brute_force(procs, objective, cache, hi, switch_cost=1)
+    assert best <= res["value"] <= best * 1.05
+    assert (res["quantum"], res["value"]) in res["history"]
+
+def test_reuses_cache_across_searches():
+    procs = list(generate(80, 1, max_burst=30))
+    cache = ResultCache(maxsize=1000)
+    tune_quantum(procs, "avg_response", cache=cache)
+    misses = cache.misses
+    tune_quantum(procs, "p99_turnaround", cache=cache, points=6)
+    assert cache.misses - misses < misses
+
+def test_per_process_quanta():
+    procs = [Process("a", 10, 0, quantum=1), Process("b", 10, 0, quantum=1), Process("c", 2, 1)]
+    kept = tune_quantum(procs, "context_switches")
+    cleared = tune_quantum(procs, "context_switches", per_process="clear")
+    assert cleared["quantum"] == 10
+    assert cleared["value"] < kept["value"]
+
+def test_invalid_arguments():
+    procs = [Process("a", 3, 0)]
+    with pytest.raises(ValueError):
+        tune_quantum(procs, "throughput")
+    with pytest.raises(ValueError):
+        tune_quantum(procs, lo=5, hi=2)
+    with pytest.raises(ValueError):
+        tune_quantum([])
+
+def test_three_points_always_narrows():
+    # Con 3 puntos y el mejor en medio los vecinos son los extremos: el rango debe encoger igual
+    import random
+    for seed in range(40):
+        rnd = random.Random(seed)
+        procs = [Process(f"P{i}", rnd.randint(1, 12), rnd.randint(0, 10)) for i in range(6)]
+        hi = max(p.burst_time for p in procs)
+        for objective in OBJECTIVES:
+            cache = ResultCache(maxsize=100)
+            res = tune_quantum(procs, objective, points=3, cache=cache)
+            assert res["evaluations"] <= hi
+            assert 1 <= res["quantum"] <= hi
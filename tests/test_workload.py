@@ -0,0 +1,57 @@
+# tests/test_workload.py
+import pytest
+
+from scheduler_sim import Scheduler
+from scheduler_trace import read_trace, write_trace
+from scheduler_workload import batches, generate
+
+def fields(procs):
+    return [(p.name, p.burst_time, p.arrival_time, p.quantum, p.priority) for p in procs]
+
+def test_seeded_and_sorted():
+    a = fields(generate(2000, 7, arrivals="bursty", bursts="pareto"))
+    assert a == fields(generate(2000, 7, arrivals="bursty", bursts="pareto"))
+    assert a != fields(generate(2000, 8, arrivals="bursty", bursts="pareto"))
+    arrivals = [x[2] for x in a]
+    assert arrivals == sorted(arrivals)
+    assert min(x[1] for x in a) >= 1
+
+@pytest.mark.parametrize("arrivals", ["poisson", "bursty"])
+@pytest.mark.parametrize("bursts", ["exponential", "pareto", "lognormal"])
+def test_rates_and_means(arrivals, bursts):
+    n = 50000
+    procs = list(generate(n, 1, rate=0.5, arrivals=arrivals, bursts=bursts, mean_burst=4, shape=2.5))
+    assert procs[-1].arrival_time / n == pytest.approx(2.0, rel=0.1)
+    # El redondeo hacia arriba suma algo menos de medio tick a la media
+    assert sum(p.burst_time for p in procs) / n == pytest.approx(4.5, rel=0.1)
+
+def test_batches_quantum_and_priority_options():
+    sizes = [len(b) for b in batches(2500, 3, batch_size=1000)]
+    assert sizes == [1000, 1000, 500]
+    procs = list(generate(4000, 3, quanta=(1, 4), quantum_share=0.25, priorities=3, max_burst=6))
+    share = sum(p.quantum is not None for p in procs) / len(procs)
+    assert share == pytest.approx(0.25, abs=0.03)
+    assert {p.quantum for p in procs} == {None, 1, 4}
+    assert {p.priority for p in procs} == {0, 1, 2}
+    assert max(p.burst_time for p in procs) == 6
+
+def test_unbounded_stream_feeds_scheduler():
+    sim = Scheduler(generate(None, 5, rate=0.1), "RR", rr_quantum=3, event_driven=True)
+    sim.simulate(2000)
+    assert sim.time == 2000
+    assert len(sim.finished) > 100
+
+@pytest.mark.parametrize("ext", ["csv", "jsonl"])
+def test_trace_roundtrip(tmp_path, ext):
+    procs = list(generate(500, 2, quanta=(2,), quantum_share=0.5, priorities=2))
+    path = str(tmp_path / f"w.{ext}")
+    assert write_trace(procs, path) == 500
+    assert fields(read_trace(path)) == fields(procs)
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        next(batches(10, arrivals="uniform"))
+    with pytest.raises(ValueError):
+        next(batches(10, bursts="pareto", shape=1))
+    with pytest.raises(ValueError):
+        next(batches(10, quantum_share=0.5))